@@ -1,2 +1,3 @@
 from __future__ import absolute_import
-from .airtable import Airtable  # noqa
+from .airtable import Airtable, BatchRequestError  # noqa
+from .record import Record  # noqa
@@ -0,0 +1,524 @@
+"""
+Asyncio Client
+**************
+
+:any:`AsyncAirtable` has the same methods as the :any:`Airtable` class,
+but they are coroutines running on an `aiohttp <https://docs.aiohttp.org>`_
+session. ``aiohttp`` must be installed to use it.
+
+>>> async with AsyncAirtable('base_key', 'table_name') as airtable:
+...     records = await airtable.get_all(view='ViewName')
+
+Pages are returned by an async generator:
+
+>>> async for page in airtable.get_iter(view='ViewName'):
+...     for record in page:
+...         value = record['fields']['COLUMN_A']
+
+Clients can share a session, and its connection pool, to work on many
+tables concurrently:
+
+>>> async with aiohttp.ClientSession() as session:
+...     orders = AsyncAirtable('base_key', 'Orders', session=session)
+...     clients = AsyncAirtable('base_key', 'Clients', session=session)
+...     results = await asyncio.gather(orders.get_all(), clients.get_all())
+
+Requests are throttled by an :any:`AsyncRateLimiter` shared by all async
+clients of the same base, and retried according to a :any:`RetryPolicy`.
+
+"""  #
+from __future__ import absolute_import
+import asyncio
+import posixpath
+from functools import partial
+from six.moves.urllib.parse import quote, unquote
+
+import requests
+
+from .airtable import (
+    AirtableBase,
+    IS_IPY,
+    _ApiLimit,
+    _chunk,
+    _raise_batch_errors,
+)
+from .auth import AirtableAuth
+from .codec import get_codec
+from .params import AirtableParams
+from .rate_limit import AsyncRateLimiter
+from .retry import RetryPolicy
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+    CONNECTION_ERRORS = (asyncio.TimeoutError,)
+else:
+    CONNECTION_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+class _Response(object):
+    """ Response read from an aiohttp response, compatible with RetryPolicy """
+
+    def __init__(self, status_code, reason, url, headers, content):
+        self.status_code = status_code
+        self.reason = reason
+        self.url = url
+        self.headers = headers
+        self.content = content
+
+
+class AsyncAirtableBase(object):
+
+    VERSION = AirtableBase.VERSION
+    API_BASE_URL = AirtableBase.API_BASE_URL
+    API_LIMIT = _ApiLimit(AirtableBase.API_LIMIT)
+    API_BURST = AirtableBase.API_BURST
+    API_URL = AirtableBase.API_URL
+    MAX_RECORDS_PER_REQUEST = AirtableBase.MAX_RECORDS_PER_REQUEST
+    MAX_URL_LENGTH = AirtableBase.MAX_URL_LENGTH
+    MAX_WORKERS = 5
+
+    def __init__(
+        self,
+        base_key,
+        api_key=None,
+        session=None,
+        rate_limiter=None,
+        retry_policy=None,
+        max_workers=None,
+        codec=None,
+    ):
+        """
+        If api_key is not provided, :any:`AirtableAuth` will attempt
+        to use ``os.environ['AIRTABLE_API_KEY']``
+
+        If session is not provided, an ``aiohttp.ClientSession`` is created
+        on the first request and closed by :any:`close`.
+
+        Batch operations send up to ``max_workers`` requests at a time,
+        still throttled by the rate limiter. Default is ``MAX_WORKERS``.
+        Failed requests are raised together as a :any:`BatchRequestError`.
+
+        If codec is not provided, the fastest JSON library installed is
+        used, see :any:`get_codec`.
+        """
+        auth = AirtableAuth(api_key=api_key)
+        self.headers = {"Authorization": "Bearer {}".format(auth.api_key)}
+        self.session = session
+        self._owns_session = session is None
+
+        if rate_limiter is None:
+            rate_limiter = AsyncRateLimiter.shared(
+                base_key, interval=self.API_LIMIT, burst=self.API_BURST
+            )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.codec = codec or get_codec()
+
+        self.base_url = posixpath.join(self.API_URL, base_key)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """ Closes the session if it was created by this client """
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self):
+        if self.session is None:
+            if aiohttp is None:
+                raise ImportError("AsyncAirtable requires aiohttp to be installed")
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    def _process_params(self, params):
+        """
+        Process params with :any:`AirtableBase._process_params` and flattens
+        them into pairs of strings accepted by aiohttp.
+        """
+        processed_params = AirtableBase._process_params(self, params)
+        flat_params = []
+        for param_name, param_value in processed_params.items():
+            if param_value is None:
+                continue
+            values = param_value if isinstance(param_value, list) else [param_value]
+            flat_params.extend((param_name, str(value)) for value in values)
+        return flat_params
+
+    _process_body = AirtableBase._process_body
+    _compile_query = AirtableBase._compile_query
+
+    def _process_response(self, response):
+        if response.status_code < 400:
+            return self.codec.loads(response.content)
+
+        err_msg = "{} Error: {} for url: {}".format(
+            response.status_code, response.reason, response.url
+        )
+        if not IS_IPY and response.status_code == 422:
+            err_msg = err_msg.replace(response.url, unquote(response.url))
+            err_msg += " (Decoded URL)"
+
+        try:
+            error_dict = self.codec.loads(response.content)
+        except ValueError:
+            pass
+        else:
+            if "error" in error_dict:
+                err_msg += " [Error: {}]".format(error_dict["error"])
+        raise requests.exceptions.HTTPError(err_msg)
+
+    def table_url(self, table_name):
+        """ Builds URL of a table """
+        url_safe_table_name = quote(table_name, safe="")
+        return posixpath.join(self.base_url, url_safe_table_name)
+
+    def record_table_url(self, table_name, record_id):
+        """ Builds URL with record id """
+        return posixpath.join(self.table_url(table_name), record_id)
+
+    async def _send(self, method, url, params=None, data=None):
+        session = self._get_session()
+        headers = self.headers
+        if data is not None:
+            headers = dict(headers, **{"Content-Type": "application/json"})
+        async with session.request(
+            method, url, params=params, data=data, headers=headers
+        ) as response:
+            content = await response.read()
+            return _Response(
+                response.status,
+                response.reason,
+                str(response.url),
+                response.headers,
+                content,
+            )
+
+    async def _request(
+        self, method, url, params=None, json_data=None, idempotent=None
+    ):
+        should_retry = partial(self.retry_policy.should_retry, idempotent=idempotent)
+        data = None if json_data is None else self.codec.dumps(json_data)
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            try:
+                response = await self._send(method, url, params, data)
+            except CONNECTION_ERRORS:
+                if not should_retry(method, attempt):
+                    raise
+                response = None
+            else:
+                if not should_retry(method, attempt, response):
+                    return self._process_response(response)
+            delay = self.retry_policy.backoff(attempt, response)
+            self.rate_limiter.penalize(delay)
+            attempt += 1
+
+    async def _get(self, url, **params):
+        processed_params = self._process_params(params)
+        return await self._request("get", url, params=processed_params)
+
+    async def _list_records(self, url, body, offset=None):
+        """ See :any:`AirtableBase._list_records` """
+        if offset:
+            body = dict(body, offset=offset)
+        url = posixpath.join(url, "listRecords")
+        return await self._request("post", url, json_data=body, idempotent=True)
+
+    async def _batch_request(self, func, iterable):
+        """
+        Runs func for each item in iterable, up to ``max_workers`` at a time.
+        See :any:`AirtableBase._batch_request`.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def call(item):
+            async with semaphore:
+                return await func(item)
+
+        results = await asyncio.gather(
+            *[call(item) for item in iterable], return_exceptions=True
+        )
+        errors = [
+            (i, r) for i, r in enumerate(results) if isinstance(r, BaseException)
+        ]
+        if errors:
+            results = [None if isinstance(r, BaseException) else r for r in results]
+            _raise_batch_errors(results, errors)
+        return results
+
+    async def get_in_table(self, table_name, record_id):
+        """ See :any:`AirtableBase.get_in_table` """
+        url = self.record_table_url(table_name, record_id)
+        return await self._get(url)
+
+    async def get_iter_in_table(self, table_name, **options):
+        """ See :any:`AirtableBase.get_iter_in_table` """
+        offset = None
+        query = self._compile_query(self.table_url(table_name), options)
+        while True:
+            if query.body is not None:
+                data = await self._list_records(query.url, query.body, offset)
+            else:
+                params = query.params + [("offset", offset)] if offset else query.params
+                data = await self._request("get", query.url, params=params)
+            yield data.get("records", [])
+            offset = data.get("offset")
+            if not offset:
+                break
+
+    async def get_all_in_table(self, table_name, **options):
+        """ See :any:`AirtableBase.get_all_in_table` """
+        all_records = []
+        async for records in self.get_iter_in_table(table_name, **options):
+            all_records.extend(records)
+        return all_records
+
+    async def match_in_table(self, table_name, field_name, field_value, **options):
+        """ See :any:`AirtableBase.match_in_table` """
+        options.pop("maxRecords", None)
+        options.update(max_records=1, page_size=1)
+        records = await self.search_in_table(
+            table_name, field_name, field_value, **options
+        )
+        return records[0] if records else {}
+
+    async def _match_id_in_table(self, table_name, field_name, field_value, **options):
+        """ See :any:`AirtableBase._match_id_in_table` """
+        options.setdefault("fields", [field_name])
+        record = await self.match_in_table(
+            table_name, field_name, field_value, **options
+        )
+        return record.get("id")
+
+    async def search_in_table(self, table_name, field_name, field_value, **options):
+        """ See :any:`AirtableBase.search_in_table` """
+        from_name_and_value = AirtableParams.FormulaParam.from_name_and_value
+        options["formula"] = from_name_and_value(field_name, field_value)
+        return await self.get_all_in_table(table_name, **options)
+
+    async def insert_in_table(self, table_name, fields, typecast=False):
+        """ See :any:`AirtableBase.insert_in_table` """
+        url = self.table_url(table_name)
+        return await self._request(
+            "post", url, json_data={"fields": fields, "typecast": typecast}
+        )
+
+    async def _batch_write(self, method, table_name, records, typecast=False):
+        url = self.table_url(table_name)
+
+        async def write_chunk(chunk):
+            data = await self._request(
+                method, url, json_data={"records": chunk, "typecast": typecast}
+            )
+            return data["records"]
+
+        chunks = _chunk(records, self.MAX_RECORDS_PER_REQUEST)
+        responses = await self._batch_request(write_chunk, chunks)
+        return [record for chunk in responses for record in chunk]
+
+    async def batch_insert_in_table(self, table_name, records, typecast=False):
+        """ See :any:`AirtableBase.batch_insert_in_table` """
+        records = [{"fields": fields} for fields in records]
+        return await self._batch_write("post", table_name, records, typecast)
+
+    async def update_in_table(self, table_name, record_id, fields, typecast=False):
+        """ See :any:`AirtableBase.update_in_table` """
+        url = self.record_table_url(table_name, record_id)
+        return await self._request(
+            "patch", url, json_data={"fields": fields, "typecast": typecast}
+        )
+
+    async def batch_update_in_table(self, table_name, records, typecast=False):
+        """ See :any:`AirtableBase.batch_update_in_table` """
+        records = [{"id": r["id"], "fields": r["fields"]} for r in records]
+        return await self._batch_write("patch", table_name, records, typecast)
+
+    async def update_by_field_in_table(
+        self, table_name, field_name, field_value, fields, typecast=False, **options
+    ):
+        """ See :any:`AirtableBase.update_by_field_in_table` """
+        record_id = await self._match_id_in_table(
+            table_name, field_name, field_value, **options
+        )
+        if not record_id:
+            return {}
+        return await self.update_in_table(table_name, record_id, fields, typecast)
+
+    async def replace_in_table(self, table_name, record_id, fields, typecast=False):
+        """ See :any:`AirtableBase.replace_in_table` """
+        url = self.record_table_url(table_name, record_id)
+        return await self._request(
+            "put", url, json_data={"fields": fields, "typecast": typecast}
+        )
+
+    async def batch_replace_in_table(self, table_name, records, typecast=False):
+        """ See :any:`AirtableBase.batch_replace_in_table` """
+        records = [{"id": r["id"], "fields": r["fields"]} for r in records]
+        return await self._batch_write("put", table_name, records, typecast)
+
+    async def replace_by_field_in_table(
+        self, table_name, field_name, field_value, fields, typecast=False, **options
+    ):
+        """ See :any:`AirtableBase.replace_by_field_in_table` """
+        record_id = await self._match_id_in_table(
+            table_name, field_name, field_value, **options
+        )
+        if not record_id:
+            return {}
+        return await self.replace_in_table(table_name, record_id, fields, typecast)
+
+    async def delete_in_table(self, table_name, record_id):
+        """ See :any:`AirtableBase.delete_in_table` """
+        url = self.record_table_url(table_name, record_id)
+        return await self._request("delete", url)
+
+    async def delete_by_field_in_table(
+        self, table_name, field_name, field_value, **options
+    ):
+        """ See :any:`AirtableBase.delete_by_field_in_table` """
+        record_id = await self._match_id_in_table(
+            table_name, field_name, field_value, **options
+        )
+        if not record_id:
+            return {}
+        return await self.delete_in_table(table_name, record_id)
+
+    async def batch_delete_in_table(self, table_name, record_ids):
+        """ See :any:`AirtableBase.batch_delete_in_table` """
+        url = self.table_url(table_name)
+
+        async def delete_chunk(chunk):
+            params = [("records[]", record_id) for record_id in chunk]
+            data = await self._request("delete", url, params=params)
+            return data["records"]
+
+        chunks = _chunk(record_ids, self.MAX_RECORDS_PER_REQUEST)
+        responses = await self._batch_request(delete_chunk, chunks)
+        return [record for chunk in responses for record in chunk]
+
+    async def mirror_in_table(self, table_name, records, **options):
+        """ See :any:`AirtableBase.mirror_in_table` """
+        all_records = await self.get_all_in_table(table_name, **options)
+        all_record_ids = [r["id"] for r in all_records]
+        deleted_records = await self.batch_delete_in_table(table_name, all_record_ids)
+        new_records = await self.batch_insert_in_table(table_name, records)
+        return (new_records, deleted_records)
+
+
+class AsyncAirtable(AsyncAirtableBase):
+    def __init__(self, base_key, table_name, api_key=None, **kwargs):
+        """
+        Asyncio version of :any:`Airtable`.
+        Keyword arguments are passed to :any:`AsyncAirtableBase`.
+        """
+        super().__init__(base_key, api_key=api_key, **kwargs)
+        self.table_name = table_name
+        self.url_table = self.table_url(table_name)
+
+    def record_url(self, record_id):
+        """ Builds URL with record id """
+        return posixpath.join(self.url_table, record_id)
+
+    async def get(self, record_id):
+        """ See :any:`Airtable.get` """
+        return await self.get_in_table(self.table_name, record_id)
+
+    def get_iter(self, **options):
+        """ See :any:`Airtable.get_iter`. Returns an async generator. """
+        return self.get_iter_in_table(self.table_name, **options)
+
+    async def get_all(self, **options):
+        """ See :any:`Airtable.get_all` """
+        return await self.get_all_in_table(self.table_name, **options)
+
+    async def match(self, field_name, field_value, **options):
+        """ See :any:`Airtable.match` """
+        return await self.match_in_table(
+            self.table_name, field_name, field_value, **options
+        )
+
+    async def search(self, field_name, field_value, **options):
+        """ See :any:`Airtable.search` """
+        return await self.search_in_table(
+            self.table_name, field_name, field_value, **options
+        )
+
+    async def insert(self, fields, typecast=False):
+        """ See :any:`Airtable.insert` """
+        return await self.insert_in_table(self.table_name, fields, typecast=typecast)
+
+    async def batch_insert(self, records, typecast=False):
+        """ See :any:`Airtable.batch_insert` """
+        return await self.batch_insert_in_table(
+            self.table_name, records, typecast=typecast
+        )
+
+    async def update(self, record_id, fields, typecast=False):
+        """ See :any:`Airtable.update` """
+        return await self.update_in_table(
+            self.table_name, record_id, fields, typecast=typecast
+        )
+
+    async def batch_update(self, records, typecast=False):
+        """ See :any:`Airtable.batch_update` """
+        return await self.batch_update_in_table(
+            self.table_name, records, typecast=typecast
+        )
+
+    async def update_by_field(
+        self, field_name, field_value, fields, typecast=False, **options
+    ):
+        """ See :any:`Airtable.update_by_field` """
+        return await self.update_by_field_in_table(
+            self.table_name, field_name, field_value, fields, typecast, **options
+        )
+
+    async def replace(self, record_id, fields, typecast=False):
+        """ See :any:`Airtable.replace` """
+        return await self.replace_in_table(
+            self.table_name, record_id, fields, typecast=typecast
+        )
+
+    async def batch_replace(self, records, typecast=False):
+        """ See :any:`Airtable.batch_replace` """
+        return await self.batch_replace_in_table(
+            self.table_name, records, typecast=typecast
+        )
+
+    async def replace_by_field(
+        self, field_name, field_value, fields, typecast=False, **options
+    ):
+        """ See :any:`Airtable.replace_by_field` """
+        return await self.replace_by_field_in_table(
+            self.table_name, field_name, field_value, fields, typecast, **options
+        )
+
+    async def delete(self, record_id):
+        """ See :any:`Airtable.delete` """
+        return await self.delete_in_table(self.table_name, record_id)
+
+    async def delete_by_field(self, field_name, field_value, **options):
+        """ See :any:`Airtable.delete_by_field` """
+        return await self.delete_by_field_in_table(
+            self.table_name, field_name, field_value, **options
+        )
+
+    async def batch_delete(self, record_ids):
+        """ See :any:`Airtable.batch_delete` """
+        return await self.batch_delete_in_table(self.table_name, record_ids)
+
+    async def mirror(self, records, **options):
+        """ See :any:`Airtable.mirror` """
+        return await self.mirror_in_table(self.table_name, records, **options)
+
+    def __repr__(self):
+        return "<AsyncAirtable table:{}>".format(self.table_name)
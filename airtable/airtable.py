@@ -26,6 +26,11 @@ Record/Page Iterator:
 ...     for record in page:
 ...         value = record['fields']['COLUMN_A']
 
+Record Iterator, pages are fetched as needed:
+
+>>> for record in airtable.iter_records(view='ViewName', limit=10):
+...     value = record['fields']['COLUMN_A']
+
 Get all Records:
 
 >>> airtable.get_all(view='ViewName',sort='COLUMN_A')
@@ -92,15 +97,20 @@ similar to this:
 
 import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 import posixpath
-import time
-import json
-from six.moves.urllib.parse import unquote, quote
+import threading
+from six.moves import queue
+from six.moves.urllib.parse import unquote, quote, urlencode
 
 from .auth import AirtableAuth
+from .codec import get_codec
 from .params import AirtableParams
+from .rate_limit import RateLimiter
+from .record import Record
+from .retry import RetryPolicy
 
 try:
     IS_IPY = sys.implementation.name == "ironpython"
@@ -108,22 +118,293 @@ except AttributeError:
     IS_IPY = False
 
 
+MirrorPlan = namedtuple(
+    "MirrorPlan", ["inserts", "updates", "deletes", "unchanged", "request_count"]
+)
+MirrorResult = namedtuple("MirrorResult", ["inserted", "updated", "deleted"])
+UpsertResult = namedtuple("UpsertResult", ["created", "updated"])
+GetManyResult = namedtuple("GetManyResult", ["records", "missing"])
+
+
+def _freeze(value):
+    """ Returns a hashable version of a field value """
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _cell_texts(cell):
+    """
+    Returns the texts a formula compares to match a cell: the text of each
+    value, and the name of collaborators
+    """
+    if isinstance(cell, list):
+        texts = set()
+        for value in cell:
+            texts.update(_cell_texts(value))
+        return texts
+    if isinstance(cell, dict):
+        return {cell["name"]} if "name" in cell else set()
+    if cell is None:
+        return set()
+    return {str(cell)}
+
+
+def _is_empty(value):
+    """ Airtable does not return empty fields, or unchecked checkboxes """
+    return value is None or value is False or value == "" or value == []
+
+
+def _chunk(iterable, size):
+    """ Yields lists of up to ``size`` items from ``iterable`` """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _prefetch(iterator, size):
+    """
+    Consumes ``iterator`` on a background thread, keeping up to ``size``
+    items ready, and yields them. Exceptions raised by ``iterator``,
+    including ``KeyboardInterrupt`` and ``SystemExit``, are raised by the
+    generator. Stops consuming once the generator is closed.
+    """
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    end = object()
+
+    def put(item, exc=None):
+        while not stop.is_set():
+            try:
+                buffer.put((item, exc), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        error = None
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as exc:
+            error = exc
+        finally:
+            # The consumer waits for the end of the stream, whatever stopped it
+            put(end, error)
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, exc = buffer.get()
+            if exc is not None:
+                raise exc
+            if item is end:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _compact_pages(pages, lazy=False):
+    """ Yields pages of :any:`Record` objects """
+    try:
+        for records in pages:
+            yield [Record.from_dict(record, lazy=lazy) for record in records]
+    finally:
+        pages.close()
+
+
+class BatchRequestError(requests.exceptions.HTTPError):
+    """
+    Raised by batch methods of clients sending requests concurrently, when
+    some of their requests failed. The other requests are still sent.
+
+    Attributes:
+        results (``list``): Result of each request, ``None`` if it failed.
+        errors (``list``): ``(index, exception)`` tuple for each failed request.
+    """
+
+    def __init__(self, results, errors):
+        self.results = results
+        self.errors = errors
+        index, exc = errors[0]
+        msg = "{} of {} batch requests failed, request {}: {}".format(
+            len(errors), len(results), index, exc
+        )
+        super().__init__(msg)
+
+
+def _raise_batch_errors(results, errors):
+    """
+    Raises the first error that is not an ``HTTPError`` unchanged,
+    or a :any:`BatchRequestError` of the failed requests
+    """
+    for _, exc in errors:
+        if not isinstance(exc, requests.exceptions.HTTPError):
+            raise exc
+    raise BatchRequestError(results, errors)
+
+
+class _CompiledQuery(object):
+    """
+    Params of a scan, processed and encoded once.
+    Only the offset changes between the pages of a scan.
+    """
+
+    def __init__(self, url, params, body=None):
+        self.url = url
+        self.params = params
+        items = params.items() if hasattr(params, "items") else params
+        self.query = urlencode(
+            [
+                (name, item)
+                for name, value in items
+                for item in (value if isinstance(value, list) else [value])
+                if item is not None
+            ]
+        )
+        # JSON body of a listRecords request, for queries too long for a url
+        self.body = body
+
+    def page_url(self, offset=None):
+        """ Returns the url of a page, with the encoded offset """
+        query = self.query
+        if offset:
+            offset_query = urlencode({"offset": offset})
+            query = "{}&{}".format(query, offset_query) if query else offset_query
+        return "{}?{}".format(self.url, query) if query else self.url
+
+
+class _Expansion(object):
+    """
+    Linked record field expanded by ``expand=``, with the records
+    already retrieved for it during a scan.
+    """
+
+    def __init__(self, field_name, table_name, fields=None, expand=None):
+        self.field_name = field_name
+        self.table_name = table_name
+        self.nested = self.from_spec(expand or {})
+        if fields:
+            fields = [fields] if hasattr(fields, "startswith") else list(fields)
+            for expansion in self.nested:
+                if expansion.field_name not in fields:
+                    fields.append(expansion.field_name)
+        self.fields = fields
+        self.records = {}
+
+    @classmethod
+    def from_spec(cls, expand):
+        """
+        Returns expansions from an ``expand`` dict of field name to table
+        name, or to a dict with ``table``, ``fields`` and ``expand`` keys.
+        """
+        expansions = []
+        for field_name, target in expand.items():
+            if hasattr(target, "startswith"):
+                target = {"table": target}
+            expansions.append(
+                cls(
+                    field_name,
+                    target["table"],
+                    fields=target.get("fields"),
+                    expand=target.get("expand"),
+                )
+            )
+        return expansions
+
+
+class _ApiLimit(object):
+    """
+    ``API_LIMIT`` of a client is the interval of its rate limiter.
+    On the class, it is the interval of the default shared limiters.
+    Setting it on a client gives the client its own rate limiter with this
+    interval, so the other clients sharing its limiter are not affected.
+    """
+
+    def __init__(self, default):
+        self.default = default
+
+    def __get__(self, instance, owner):
+        limiter = getattr(instance, "rate_limiter", None)
+        return self.default if limiter is None else limiter.interval
+
+    def __set__(self, instance, interval):
+        limiter = instance.rate_limiter
+        instance.rate_limiter = type(limiter)(interval=interval, burst=limiter.burst)
+
+
 class AirtableBase:
 
     VERSION = "v0"
     API_BASE_URL = "https://api.airtable.com/"
-    API_LIMIT = 1.0 / 5  # 5 per second
+    API_LIMIT = _ApiLimit(1.0 / 5)  # 5 per second
+    API_BURST = 1
     API_URL = posixpath.join(API_BASE_URL, VERSION)
-
-    def __init__(self, base_key, api_key=None):
+    MAX_RECORDS_PER_REQUEST = 10
+    MAX_FORMULA_LENGTH = 2000
+    MAX_URL_LENGTH = 16000
+
+    def __init__(
+        self,
+        base_key,
+        api_key=None,
+        rate_limiter=None,
+        retry_policy=None,
+        max_workers=None,
+        record_cache=None,
+        query_cache=None,
+        codec=None,
+    ):
         """
         If api_key is not provided, :any:`AirtableAuth` will attempt
         to use ``os.environ['AIRTABLE_API_KEY']``
+
+        If rate_limiter is not provided, a :any:`RateLimiter` is shared
+        by all clients of the same ``base_key``.
+
+        If retry_policy is not provided, a default :any:`RetryPolicy` is used.
+
+        If max_workers is greater than 1, batch operations send up to
+        ``max_workers`` requests at a time, still throttled by the rate limiter,
+        and raise a :any:`BatchRequestError` once all requests are done if
+        some failed. Otherwise they stop at the first failed request.
+
+        If record_cache is provided, records retrieved with
+        :any:`get_in_table` are kept in this :any:`RecordCache`.
+
+        If query_cache is provided, results of :any:`get_all_in_table` and
+        :any:`search_in_table` are kept in this :any:`QueryCache`.
+
+        If codec is not provided, bodies are encoded and decoded with the
+        fastest JSON library installed, see :any:`get_codec`.
         """
         session = requests.Session()
         session.auth = AirtableAuth(api_key=api_key)
         self.session = session
 
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.shared(
+                base_key, interval=self.API_LIMIT, burst=self.API_BURST
+            )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.max_workers = max_workers or 1
+        self.record_cache = record_cache
+        self.query_cache = query_cache
+        self.codec = codec or get_codec()
+
         self.base_url = posixpath.join(self.API_URL, base_key)
 
     def _process_params(self, params):
@@ -138,6 +419,30 @@ class AirtableBase:
                 param_value).to_param_dict())
         return new_params
 
+    def _process_body(self, params):
+        """
+        Process params into the JSON body of a ``listRecords`` request
+        """
+        body = OrderedDict()
+        for param_name, param_value in sorted(params.items()):
+            if param_value is None:
+                continue
+            params_class = AirtableParams._get(param_name)
+            body.update(params_class(param_value).to_body_dict())
+        return body
+
+    def _compile_query(self, url, params):
+        """
+        Processes params once for all the pages of a scan. The query also
+        gets the JSON body of a ``listRecords`` request if the encoded
+        params make the url longer than ``MAX_URL_LENGTH``.
+        """
+        query = _CompiledQuery(url, self._process_params(params))
+        # Leaves room for the offset of the next pages
+        if len(query.page_url()) + 100 > self.MAX_URL_LENGTH:
+            query.body = self._process_body(params)
+        return query
+
     def _process_response(self, response):
         try:
             response.raise_for_status()
@@ -153,24 +458,63 @@ class AirtableBase:
 
             # Attempt to get Error message from response, Issue #16
             try:
-                error_dict = response.json()
-            except json.decoder.JSONDecodeError:
+                error_dict = self.codec.loads(response.content)
+            except ValueError:
                 pass
             else:
                 if "error" in error_dict:
                     err_msg += " [Error: {}]".format(error_dict["error"])
             raise requests.exceptions.HTTPError(err_msg)
         else:
-            return response.json()
+            return self.codec.loads(response.content)
 
-    def record_table_url(self, table_name, record_id):
-        """ Builds URL with record id """
+    def table_url(self, table_name):
+        """ Builds URL of a table """
         url_safe_table_name = quote(table_name, safe="")
-        return posixpath.join(self.base_url, url_safe_table_name, record_id)
+        return posixpath.join(self.base_url, url_safe_table_name)
 
-    def _request(self, method, url, params=None, json_data=None):
-        response = self.session.request(method, url, params=params, json=json_data)
-        return self._process_response(response)
+    def record_table_url(self, table_name, record_id):
+        """ Builds URL with record id """
+        return posixpath.join(self.table_url(table_name), record_id)
+
+    def _request(self, method, url, params=None, json_data=None, idempotent=None):
+        should_retry = partial(self.retry_policy.should_retry, idempotent=idempotent)
+        data, headers = None, None
+        if json_data is not None:
+            # Encoded once for all attempts
+            data = self.codec.dumps(json_data)
+            headers = {"Content-Type": "application/json"}
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.request(
+                    method, url, params=params, data=data, headers=headers
+                )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ):
+                if not should_retry(method, attempt):
+                    raise
+                response = None
+            else:
+                if not should_retry(method, attempt, response):
+                    return self._process_response(response)
+            # Backoff is applied by the shared limiter on the next acquire
+            delay = self.retry_policy.backoff(attempt, response)
+            self.rate_limiter.penalize(delay)
+            attempt += 1
+
+    def _on_write(self, table_name, records=(), deleted_ids=()):
+        """ Refreshes cached records after records of a table were written """
+        if self.query_cache is not None:
+            self.query_cache.invalidate_table(table_name)
+        if self.record_cache is not None:
+            for record in records:
+                self.record_cache.set(table_name, record)
+            for record_id in deleted_ids:
+                self.record_cache.invalidate(table_name, record_id)
 
     def _get(self, url, **params):
         processed_params = self._process_params(params)
@@ -185,12 +529,22 @@ class AirtableBase:
     def _patch(self, url, json_data):
         return self._request("patch", url, json_data=json_data)
 
-    def _delete(self, url):
-        return self._request("delete", url)
+    def _delete(self, url, params=None):
+        return self._request("delete", url, params=params)
+
+    def _list_records(self, url, body, offset=None):
+        """
+        Retrieves a page of records with a ``POST`` request, for queries
+        too long for an url. Retried like a ``GET`` request.
+        """
+        if offset:
+            body = dict(body, offset=offset)
+        url = posixpath.join(url, "listRecords")
+        return self._request("post", url, json_data=body, idempotent=True)
 
     def get_in_table(self, table_name, record_id):
         """
-        Retrieves a record by its id
+        Retrieves a record by its id, from ``record_cache`` if it is set.
         >>> record = airtable.get_in_table('table_name', 'recwPQIfs4wKPyc9D')
         Args:
             table_name(``str``): Airtable table name
@@ -198,8 +552,66 @@ class AirtableBase:
         Returns:
             record (``dict``): Record
         """
+        if self.record_cache is not None:
+            record = self.record_cache.get(table_name, record_id)
+            if record is not None:
+                return record
         url = self.record_table_url(table_name, record_id)
-        return self._get(url)
+        record = self._get(url)
+        if self.record_cache is not None:
+            self.record_cache.set(table_name, record)
+        return record
+
+    def get_many_in_table(self, table_name, record_ids, **options):
+        """
+        Retrieves records by their ids, with ``OR(RECORD_ID()=...)`` formulas
+        of up to ``MAX_FORMULA_LENGTH`` characters instead of one request per
+        record. Records in ``record_cache`` are not requested, unless
+        ``fields`` are given.
+        >>> airtable.get_many_in_table('table_name', ['rec1', 'rec2'])
+        GetManyResult(records=[{'id': 'rec1', ...}], missing=['rec2'])
+        Args:
+            table_name(``str``): Airtable table name
+            record_ids(``list``): Airtable record ids
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParameter`.
+            fields (``str``, ``list``, optional): Name of field or fields to
+                be retrieved. Default is all fields. See :any:`FieldsParameter`.
+        Returns:
+            result (``GetManyResult``): ``records`` in the order of
+                ``record_ids``, and ``missing`` record ids
+        """
+        use_cache = self.record_cache is not None and not options.get("fields")
+        found = {}
+        for record_id in OrderedDict.fromkeys(record_ids):
+            record = self.record_cache.get(table_name, record_id) if use_cache else None
+            if record is not None:
+                found[record_id] = record
+
+        formulas = AirtableParams.FormulaParam.or_chunks(
+            [
+                "RECORD_ID()='{}'".format(record_id)
+                for record_id in OrderedDict.fromkeys(record_ids)
+                if record_id not in found
+            ],
+            max_length=self.MAX_FORMULA_LENGTH,
+        )
+
+        def get_chunk(formula):
+            pages = self.get_iter_in_table(table_name, formula=formula, **options)
+            return [record for page in pages for record in page]
+
+        for records in self._batch_request(get_chunk, formulas):
+            for record in records:
+                found[record["id"]] = record
+                if use_cache:
+                    self.record_cache.set(table_name, record)
+
+        return GetManyResult(
+            [found[record_id] for record_id in record_ids if record_id in found],
+            [record_id for record_id in record_ids if record_id not in found],
+        )
 
     def get_iter_in_table(self, table_name, **options):
         """
@@ -226,21 +638,130 @@ class AirtableBase:
                 Default order is ascending. See :any:`SortParameter`.
             formula (``str``, optional): Airtable formula.
                 See :any:`FormulaParameter`.
+            prefetch (``int``, optional): Number of pages fetched ahead on
+                a background thread while the current page is processed.
+                Default is 0, pages are fetched when requested.
+            expand (``dict``, optional): Linked record fields to replace with
+                the linked records, by field name. Values are a table name,
+                or a dict with ``table``, and optional ``fields`` and nested
+                ``expand`` keys. Linked records are retrieved in batches and
+                only once per scan.
+            compact (``bool``, optional): Returns :any:`Record` objects,
+                which use less memory than dicts. Default is False.
+            lazy (``bool``, optional): Returns :any:`Record` objects which
+                only decode their fields when they are accessed.
+                Default is False.
+        If the url would be longer than ``MAX_URL_LENGTH``, the params are
+        sent in the body of ``POST`` requests to ``listRecords`` instead.
         Returns:
             iterator (``list``): List of Records, grouped by pageSize
         """
-        offset = None
-        url_safe_table_name = quote(table_name, safe="")
-        url = posixpath.join(self.base_url, url_safe_table_name)
+        prefetch = options.pop("prefetch", 0)
+        expand = options.pop("expand", None)
+        compact = options.pop("compact", False)
+        lazy = options.pop("lazy", False)
+        pages = self._iter_pages(table_name, **options)
+        if expand:
+            pages = self._expand_pages(pages, _Expansion.from_spec(expand))
+        if compact or lazy:
+            pages = _compact_pages(pages, lazy)
+        return _prefetch(pages, prefetch) if prefetch else pages
+
+    def _expand_pages(self, pages, expansions):
+        try:
+            for records in pages:
+                self._expand_records(records, expansions)
+                yield records
+        finally:
+            pages.close()
+
+    def _expand_records(self, records, expansions):
+        """
+        Replaces the ids of linked record fields with the linked records.
+        Ids not yet retrieved in the scan are retrieved with
+        :any:`get_many_in_table`. Ids of missing records are left as is.
+        """
+        for expansion in expansions:
+            field_name = expansion.field_name
+            record_ids = OrderedDict()
+            for record in records:
+                for record_id in record["fields"].get(field_name) or []:
+                    if record_id not in expansion.records:
+                        record_ids[record_id] = None
+
+            if record_ids:
+                options = {"fields": expansion.fields} if expansion.fields else {}
+                result = self.get_many_in_table(
+                    expansion.table_name, list(record_ids), **options
+                )
+                self._expand_records(result.records, expansion.nested)
+                for record in result.records:
+                    expansion.records[record["id"]] = record
+                for record_id in result.missing:
+                    expansion.records[record_id] = None
+
+            for record in records:
+                record_ids = record["fields"].get(field_name)
+                if record_ids:
+                    record["fields"][field_name] = [
+                        expansion.records.get(record_id) or record_id
+                        for record_id in record_ids
+                    ]
+
+    def _iter_pages(self, table_name, **options):
+        for data in self._iter_responses(table_name, **options):
+            yield data.get("records", [])
+
+    def _iter_responses(self, table_name, offset=None, **options):
+        """
+        Yields the response of each page, starting from ``offset``.
+        The offset of the next page is in the ``offset`` key.
+        """
+        query = self._compile_query(self.table_url(table_name), options)
         while True:
-            data = self._get(url, offset=offset, **options)
-            records = data.get("records", [])
-            time.sleep(self.API_LIMIT)
-            yield records
+            if query.body is None:
+                data = self._request("get", query.page_url(offset))
+            else:
+                data = self._list_records(query.url, query.body, offset)
+            yield data
             offset = data.get("offset")
             if not offset:
                 break
 
+    def iter_records_in_table(self, table_name, limit=None, **options):
+        """
+        Record Iterator
+        Yields records one at a time, fetching pages as they are needed.
+        No more pages are requested once the iterator is closed or
+        ``limit`` records were returned.
+        >>> for record in airtable.iter_records_in_table(table_name, limit=5):
+        ...     print(record)
+        {'fields': ... }
+        Args:
+            table_name(``str``): Airtable table name
+            limit(``int``, optional): Maximum number of records to return.
+        Keyword Args:
+            See :any:`get_iter_in_table`.
+        Returns:
+            iterator (``dict``): Records
+        """
+        if limit is not None:
+            if limit <= 0:
+                return
+            if "page_size" not in options and "pageSize" not in options:
+                options["page_size"] = min(limit, 100)
+        count = 0
+        pages = self.get_iter_in_table(table_name, **options)
+        try:
+            for records in pages:
+                for record in records:
+                    yield record
+                    count += 1
+                    if count == limit:
+                        return
+        finally:
+            pages.close()
+
     def get_all_in_table(self, table_name, **options):
         """
         Retrieves all records repetitively and returns a single list.
@@ -261,10 +782,26 @@ class AirtableBase:
                 Default order is ascending. See :any:`SortParameter`.
             formula (``str``, optional): Airtable formula.
                 See :any:`FormulaParameter`.
+            expand (``dict``, optional): Linked record fields to replace with
+                the linked records. See :any:`get_iter_in_table`.
+                Results are not kept in ``query_cache``.
+            compact, lazy (``bool``, optional): Returns :any:`Record` objects.
+                See :any:`get_iter_in_table`. Results are not kept in
+                ``query_cache``.
         Returns:
             records (``list``): List of Records
         >>> records = get_all(maxRecords=3, view='All')
         """
+        params = dict(options)
+        uncached = [params.pop(name, None) for name in ("expand", "compact", "lazy")]
+        params.pop("prefetch", None)
+        if self.query_cache is None or any(uncached):
+            return self._get_all_in_table(table_name, **options)
+        key = self.query_cache.make_key(table_name, self._process_params(params))
+        loader = partial(self._get_all_in_table, table_name, **options)
+        return self.query_cache.get(key, loader)
+
+    def _get_all_in_table(self, table_name, **options):
         all_records = []
         for records in self.get_iter_in_table(table_name, **options):
             all_records.extend(records)
@@ -272,7 +809,8 @@ class AirtableBase:
 
     def match_in_table(self, table_name, field_name, field_value, **options):
         """
-        Returns first match found in :any:`get_all`
+        Returns first match found in :any:`get_all`.
+        Only one record is requested, in a single request.
         >>> airtable.match_in_table('table_name', 'Name', 'John')
         {'fields': {'Name': 'John'} }
         Args:
@@ -280,8 +818,6 @@ class AirtableBase:
             field_name (``str``): Name of field to match (column name).
             field_value (``str``): Value of field to match.
         Keyword Args:
-            max_records (``int``, optional): The maximum total number of
-                records that will be returned. See :any:`MaxRecordsParameter`
             view (``str``, optional): The name or ID of a view.
                 See :any:`ViewParameter`.
             fields (``str``, ``list``, optional): Name of field or fields to
@@ -291,13 +827,24 @@ class AirtableBase:
         Returns:
             record (``dict``): First record to match the field_value provided
         """
-        from_name_and_value = AirtableParams.FormulaParameter.from_name_and_value
+        from_name_and_value = AirtableParams.FormulaParam.from_name_and_value
         formula = from_name_and_value(field_name, field_value)
         options["formula"] = formula
-        for record in self.get_all_in_table(table_name, **options):
+        options.pop("maxRecords", None)
+        options["max_records"] = 1
+        for record in self.iter_records_in_table(table_name, limit=1, **options):
             return record
         return {}
 
+    def _match_id_in_table(self, table_name, field_name, field_value, **options):
+        """
+        Returns the id of the first match, or None.
+        Only ``field_name`` is retrieved unless ``fields`` are given.
+        """
+        options.setdefault("fields", [field_name])
+        record = self.match_in_table(table_name, field_name, field_value, **options)
+        return record.get("id")
+
     def search_in_table(self, table_name, field_name, field_value, **options):
         """
         Returns all matching records found in :any:`get_all`
@@ -320,12 +867,88 @@ class AirtableBase:
             records (``list``): All records that matched ``field_value``
         """
         records = []
-        from_name_and_value = AirtableParams.FormulaParameter.from_name_and_value
+        from_name_and_value = AirtableParams.FormulaParam.from_name_and_value
         formula = from_name_and_value(field_name, field_value)
         options["formula"] = formula
         records = self.get_all_in_table(table_name, **options)
         return records
 
+    def search_many_in_table(self, table_name, field_name, field_values, **options):
+        """
+        Returns records matching each of ``field_values``. Values are looked
+        up with ``OR()`` formulas of up to ``MAX_FORMULA_LENGTH`` characters,
+        instead of one query per value. Records are grouped by the text of
+        their cells, as formulas compare them, using the name of collaborators.
+        >>> airtable.search_many_in_table('table_name', 'Name', ['John', 'Marc'])
+        OrderedDict([('John', [{'id': ...}]), ('Marc', [])])
+        Args:
+            table_name(``str``): Airtable table name
+            field_name (``str``): Name of field to match (column name).
+            field_values (``list``): Values of field to match.
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParameter`.
+            fields (``str``, ``list``, optional): Name of field or fields to
+                be retrieved. ``field_name`` is always retrieved.
+                See :any:`FieldsParameter`.
+            sort (``list``, optional): List of fields to sort by.
+                Default order is ascending. See :any:`SortParameter`.
+        Returns:
+            records (``OrderedDict``): Matching records by value,
+                in the order of ``field_values``
+        """
+        groups = OrderedDict((value, []) for value in field_values)
+        fields = options.get("fields")
+        if fields:
+            fields = [fields] if hasattr(fields, "startswith") else list(fields)
+            if field_name not in fields:
+                fields.append(field_name)
+            options["fields"] = fields
+        from_name_and_values = AirtableParams.FormulaParam.from_name_and_values
+        formulas = from_name_and_values(
+            field_name, list(groups), max_length=self.MAX_FORMULA_LENGTH
+        )
+        get_all = partial(self.get_all_in_table, table_name, **options)
+        # Formulas compare the text of cells, so values are matched by text
+        matches = {}
+        for value in groups:
+            matches.setdefault(str(value), []).append(value)
+        for records in self._batch_request(lambda f: get_all(formula=f), formulas):
+            for record in records:
+                cell = record["fields"].get(field_name)
+                for text in _cell_texts(cell):
+                    for value in matches.get(text, ()):
+                        groups[value].append(record)
+        return groups
+
+    def match_many_in_table(self, table_name, field_name, field_values, **options):
+        """
+        Returns the first record to match each of ``field_values``, or ``{}``.
+        See :any:`search_many_in_table`.
+        >>> airtable.match_many_in_table('table_name', 'Name', ['John', 'Marc'])
+        OrderedDict([('John', {'id': ...}), ('Marc', {})])
+        Args:
+            table_name(``str``): Airtable table name
+            field_name (``str``): Name of field to match (column name).
+            field_values (``list``): Values of field to match.
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParameter`.
+            fields (``str``, ``list``, optional): Name of field or fields to
+                be retrieved. ``field_name`` is always retrieved.
+                See :any:`FieldsParameter`.
+            sort (``list``, optional): List of fields to sort by.
+                Default order is ascending. See :any:`SortParameter`.
+        Returns:
+            records (``OrderedDict``): First matching record by value
+        """
+        groups = self.search_many_in_table(
+            table_name, field_name, field_values, **options
+        )
+        return OrderedDict(
+            (value, records[0] if records else {}) for value, records in groups.items()
+        )
+
     def insert_in_table(self, table_name, fields, typecast=False):
         """
         Inserts a record
@@ -339,23 +962,51 @@ class AirtableBase:
         Returns:
             record (``dict``): Inserted record
         """
-        url_safe_table_name = quote(table_name, safe="")
-        url = posixpath.join(self.base_url, url_safe_table_name)
-        return self._post(
-            url, json_data={"fields": fields, "typecast": typecast}
-        )
+        url = self.table_url(table_name)
+        record = self._post(url, json_data={"fields": fields, "typecast": typecast})
+        self._on_write(table_name, records=[record])
+        return record
 
     def _batch_request(self, func, iterable):
-        """ Internal Function to limit batch calls to API limit """
-        responses = []
-        for item in iterable:
-            responses.append(func(item))
-            time.sleep(self.API_LIMIT)
-        return responses
+        """
+        Internal Function to call func for each item in iterable.
+        Calls run one after the other, stopping at the first error, unless
+        ``max_workers`` is greater than 1. They then run on a thread pool,
+        failed requests do not stop the others, and are raised together as a
+        :any:`BatchRequestError` once all calls are done.
+        """
+        if self.max_workers <= 1:
+            return [func(item) for item in iterable]
+
+        items = list(iterable)
+        results = [None] * len(items)
+        errors = []
+
+        def call(index):
+            try:
+                results[index] = func(items[index])
+            except Exception as exc:
+                errors.append((index, exc))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(call, range(len(items))))
+
+        if errors:
+            _raise_batch_errors(results, sorted(errors, key=lambda e: e[0]))
+        return results
+
+    def _batch_insert_chunk(self, table_name, records, typecast=False):
+        """ Inserts up to ``MAX_RECORDS_PER_REQUEST`` records in one request """
+        url = self.table_url(table_name)
+        records = [{"fields": fields} for fields in records]
+        data = self._post(url, json_data={"records": records, "typecast": typecast})
+        self._on_write(table_name, records=data["records"])
+        return data["records"]
 
     def batch_insert_in_table(self, table_name, records, typecast=False):
         """
-        Calls :any:`insert` repetitively, following set API Rate Limit (5/sec)
+        Inserts records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        records per request, following set API Rate Limit (5/sec)
         To change the rate limit use ``airtable.API_LIMIT = 0.2``
         (5 per second)
         >>> records = [{'Name': 'John'}, {'Name': 'Marc'}]
@@ -363,11 +1014,15 @@ class AirtableBase:
         Args:
             table_name(``str``): Airtable table name
             records(``list``): Records to insert
+            typecast(``boolean``): Automatic data conversion from string values.
         Returns:
-            records (``list``): list of added records
+            records (``list``): list of added records, in the same order
+                as ``records``
         """
-        table_insert = partial(self.insert_in_table, table_name, typecast=typecast)
-        return self._batch_request(table_insert, records)
+        chunk_insert = partial(self._batch_insert_chunk, table_name, typecast=typecast)
+        chunks = _chunk(records, self.MAX_RECORDS_PER_REQUEST)
+        responses = self._batch_request(chunk_insert, chunks)
+        return [record for chunk in responses for record in chunk]
 
     def update_in_table(self, table_name, record_id, fields, typecast=False):
         """
@@ -385,9 +1040,45 @@ class AirtableBase:
             record (``dict``): Updated record
         """
         url = self.record_table_url(table_name, record_id)
-        return self._patch(
-            url, json_data={"fields": fields, "typecast": typecast}
+        record = self._patch(url, json_data={"fields": fields, "typecast": typecast})
+        self._on_write(table_name, records=[record])
+        return record
+
+    def _batch_write_chunk(self, method, table_name, records, typecast=False):
+        """ Updates or replaces up to ``MAX_RECORDS_PER_REQUEST`` records """
+        url = self.table_url(table_name)
+        records = [{"id": r["id"], "fields": r["fields"]} for r in records]
+        data = self._request(
+            method, url, json_data={"records": records, "typecast": typecast}
         )
+        self._on_write(table_name, records=data["records"])
+        return data["records"]
+
+    def _batch_write(self, method, table_name, records, typecast=False):
+        chunk_write = partial(
+            self._batch_write_chunk, method, table_name, typecast=typecast
+        )
+        chunks = _chunk(records, self.MAX_RECORDS_PER_REQUEST)
+        responses = self._batch_request(chunk_write, chunks)
+        return [record for chunk in responses for record in chunk]
+
+    def batch_update_in_table(self, table_name, records, typecast=False):
+        """
+        Updates records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        records per request, following set API Rate Limit (5/sec).
+        Only Fields passed are updated, the rest are left as is.
+        >>> records = [{'id': 'recwPQIfs4wKPyc9D', 'fields': {'Status': 'Fired'}}]
+        >>> airtable.batch_update_in_table('table_name', records)
+        Args:
+            table_name(``str``): Airtable table name
+            records(``list``): Records to update. Each record must be a
+                dictionary with ``id`` and ``fields`` keys.
+            typecast(``boolean``): Automatic data conversion from string values.
+        Returns:
+            records (``list``): list of updated records, in the same order
+                as ``records``
+        """
+        return self._batch_write("patch", table_name, records, typecast=typecast)
 
     def update_by_field_in_table(
         self, table_name, field_name, field_value, fields, typecast=False, **options
@@ -412,8 +1103,66 @@ class AirtableBase:
         Returns:
             record (``dict``): Updated record
         """
-        record = self.match_in_table(table_name, field_name, field_value, **options)
-        return {} if not record else self.update(table_name, record["id"], fields, typecast)
+        record_id = self._match_id_in_table(
+            table_name, field_name, field_value, **options
+        )
+        if not record_id:
+            return {}
+        return self.update_in_table(table_name, record_id, fields, typecast)
+
+    def batch_upsert_in_table(
+        self, table_name, records, key_fields, typecast=False, **options
+    ):
+        """
+        Updates records matching the values of ``key_fields``, and inserts
+        the others. Existing records are retrieved once, with only the key
+        fields, instead of a match per record.
+        >>> records = [{'Email': 'john@example.com', 'Name': 'John'}]
+        >>> airtable.batch_upsert_in_table('table_name', records, 'Email')
+        UpsertResult(created=[...], updated=[...])
+        Args:
+            table_name(``str``): Airtable table name
+            records(``list``): Fields of the records to upsert
+            key_fields(``str``, ``list``): Name of field or fields used to
+                match records.
+            typecast(``boolean``): Automatic data conversion from string values.
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParameter`.
+            formula (``str``, optional): Airtable formula.
+                See :any:`FormulaParameter`.
+        Raises:
+            ValueError: If two records have the same key, or a key matches
+                more than one existing record.
+        Returns:
+            result (``UpsertResult``): ``created`` and ``updated`` records
+        """
+        if hasattr(key_fields, "startswith"):
+            key_fields = [key_fields]
+        keys = [tuple(_freeze(fields.get(f)) for f in key_fields) for fields in records]
+        seen = set()
+        for key in keys:
+            if key in seen:
+                raise ValueError("duplicate key in records: {}".format(key))
+            seen.add(key)
+
+        options["fields"] = list(key_fields)
+        index = self._key_index_in_table(table_name, key_fields, **options)
+        creates, updates = [], []
+        for key, fields in zip(keys, records):
+            matches = index.get(key)
+            if not matches:
+                creates.append(fields)
+            elif len(matches) > 1:
+                raise ValueError(
+                    "key {} matches records {}".format(key, [r["id"] for r in matches])
+                )
+            else:
+                updates.append({"id": matches[0]["id"], "fields": fields})
+
+        created = self.batch_insert_in_table(table_name, creates, typecast=typecast)
+        updated = self.batch_update_in_table(table_name, updates, typecast=typecast)
+        return UpsertResult(created, updated)
 
     def replace_in_table(self, table_name, record_id, fields, typecast=False):
         """
@@ -434,7 +1183,29 @@ class AirtableBase:
             record (``dict``): New record
         """
         record_url = self.record_table_url(table_name, record_id)
-        return self._put(record_url, json_data={"fields": fields, "typecast": typecast})
+        record = self._put(
+            record_url, json_data={"fields": fields, "typecast": typecast}
+        )
+        self._on_write(table_name, records=[record])
+        return record
+
+    def batch_replace_in_table(self, table_name, records, typecast=False):
+        """
+        Replaces records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        records per request, following set API Rate Limit (5/sec).
+        If a field is not included in ``fields``, value will bet set to null.
+        >>> records = [{'id': 'recwPQIfs4wKPyc9D', 'fields': {'Name': 'Mike'}}]
+        >>> airtable.batch_replace_in_table('table_name', records)
+        Args:
+            table_name(``str``): Airtable table name
+            records(``list``): Records to replace. Each record must be a
+                dictionary with ``id`` and ``fields`` keys.
+            typecast(``boolean``): Automatic data conversion from string values.
+        Returns:
+            records (``list``): list of new records, in the same order
+                as ``records``
+        """
+        return self._batch_write("put", table_name, records, typecast=typecast)
 
     def replace_by_field_in_table(
         self, table_name, field_name, field_value, fields, typecast=False, **options
@@ -459,8 +1230,12 @@ class AirtableBase:
         Returns:
             record (``dict``): New record
         """
-        record = self.match_in_table(table_name, field_name, field_value, **options)
-        return {} if not record else self.replace_in_table(table_name, record["id"], fields, typecast)
+        record_id = self._match_id_in_table(
+            table_name, field_name, field_value, **options
+        )
+        if not record_id:
+            return {}
+        return self.replace_in_table(table_name, record_id, fields, typecast)
 
     def delete_in_table(self, table_name, record_id):
         """
@@ -474,7 +1249,9 @@ class AirtableBase:
             record (``dict``): Deleted Record
         """
         record_url = self.record_table_url(table_name, record_id)
-        return self._delete(record_url)
+        deleted_record = self._delete(record_url)
+        self._on_write(table_name, deleted_ids=[record_id])
+        return deleted_record
 
     def delete_by_field_in_table(self, table_name, field_name, field_value, **options):
         """
@@ -493,27 +1270,115 @@ class AirtableBase:
         Returns:
             record (``dict``): Deleted Record
         """
-        record = self.match_in_table(table_name, field_name, field_value, **options)
-        record_url = self.record_table_url(table_name, record["id"])
-        return self._delete(record_url)
+        record_id = self._match_id_in_table(
+            table_name, field_name, field_value, **options
+        )
+        if not record_id:
+            return {}
+        return self.delete_in_table(table_name, record_id)
 
-    def batch_delete(self, table_name, record_ids):
+    def _batch_delete_chunk(self, table_name, record_ids):
+        """ Deletes up to ``MAX_RECORDS_PER_REQUEST`` records in one request """
+        url = self.table_url(table_name)
+        data = self._delete(url, params={"records[]": record_ids})
+        self._on_write(table_name, deleted_ids=record_ids)
+        return data["records"]
+
+    def batch_delete_in_table(self, table_name, record_ids):
         """
-        Calls :any:`delete` repetitively, following set API Rate Limit (5/sec)
+        Deletes records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        record ids per request, following set API Rate Limit (5/sec)
         To change the rate limit set value of ``airtable.API_LIMIT`` to
         the time in seconds it should sleep before calling the function again.
         >>> record_ids = ['recwPQIfs4wKPyc9D', 'recwDxIfs3wDPyc3F']
-        >>> airtable.batch_delete('table_name', records_ids)
+        >>> airtable.batch_delete_in_table('table_name', records_ids)
         Args:
             table_name(``str``): Airtable table name
             records(``list``): Record Ids to delete
         Returns:
             records(``list``): list of records deleted
         """
-        table_delete = partial(self.delete_in_table, table_name)
-        return self._batch_request(table_delete, record_ids)
+        chunk_delete = partial(self._batch_delete_chunk, table_name)
+        chunks = _chunk(record_ids, self.MAX_RECORDS_PER_REQUEST)
+        responses = self._batch_request(chunk_delete, chunks)
+        return [record for chunk in responses for record in chunk]
+
+    def _key_index_in_table(self, table_name, key_fields, **options):
+        """
+        Retrieves records and returns a dict of lists of records by the
+        values of ``key_fields``. Records without key values are listed
+        under ``None``, so they never match a key.
+        """
+        index = {}
+        for records in self.get_iter_in_table(table_name, **options):
+            for record in records:
+                key = tuple(_freeze(record["fields"].get(f)) for f in key_fields)
+                if all(value is None for value in key):
+                    key = None
+                index.setdefault(key, []).append(record)
+        return index
 
-    def mirror_in_table(self, table_name, records, **options):
+    def plan_mirror_in_table(self, table_name, records, key_field=None, **options):
+        """
+        Returns the changes :any:`mirror_in_table` would make, without
+        making them. See :any:`mirror_in_table`.
+        Returns:
+            plan (``MirrorPlan``): ``inserts`` fields, ``updates`` records,
+                ``deletes`` record ids, ``unchanged`` record ids, and the
+                ``request_count`` of write requests needed.
+        """
+        inserts, updates, deletes, unchanged = [], [], [], []
+        if key_field is None:
+            inserts = list(records)
+            deletes = [
+                record["id"]
+                for page in self.get_iter_in_table(table_name, **options)
+                for record in page
+            ]
+        else:
+            key_fields = [key_field] if hasattr(key_field, "startswith") else key_field
+            columns = set(key_fields)
+            for fields in records:
+                columns.update(fields)
+            options.setdefault("fields", sorted(columns))
+            index = self._key_index_in_table(table_name, key_fields, **options)
+
+            for fields in records:
+                key = tuple(_freeze(fields.get(f)) for f in key_fields)
+                matches = index.get(key)
+                if not matches:
+                    inserts.append(fields)
+                    continue
+                record = matches.pop(0)
+                changed = {}
+                for column in columns:
+                    value = fields.get(column)
+                    current = record["fields"].get(column)
+                    if _is_empty(value) and _is_empty(current):
+                        continue
+                    if _freeze(value) != _freeze(current):
+                        changed[column] = value
+                if changed:
+                    updates.append({"id": record["id"], "fields": changed})
+                else:
+                    unchanged.append(record["id"])
+            deletes = [r["id"] for matches in index.values() for r in matches]
+
+        size = self.MAX_RECORDS_PER_REQUEST
+        request_count = sum(
+            -(-len(items) // size) for items in (inserts, updates, deletes)
+        )
+        return MirrorPlan(inserts, updates, deletes, unchanged, request_count)
+
+    def mirror_in_table(
+        self,
+        table_name,
+        records,
+        key_field=None,
+        dry_run=False,
+        typecast=False,
+        **options
+    ):
         """
         Deletes all records on table or view and replaces with records.
         >>> records = [{'Name': 'John'}, {'Name': 'Marc'}]
@@ -522,32 +1387,59 @@ class AirtableBase:
         be deleted.
         >>> record = airtable.mirror_in_table('table_name', records, view='View')
         ([{'id': 'recwPQIfs4wKPyc9D', ... }], [{'deleted': True, ... }])
+        If ``key_field`` is provided, records are matched to existing records
+        by the values of ``key_field``, and only the changes are sent:
+        new records are inserted, changed fields are updated, and records
+        that were not matched are deleted. Records with empty keys never
+        match, so existing ones are deleted and new ones inserted. Only the
+        fields present in ``records`` are compared and updated.
+        >>> airtable.mirror_in_table('table_name', records, key_field='Name')
+        MirrorResult(inserted=[...], updated=[...], deleted=[...])
         Args:
             table_name(``str``): Airtable table name
             records(``list``): Records to insert
+            key_field(``str``, ``list``, optional): Name of field or fields
+                used to match records.
+            dry_run(``boolean``): Return the :any:`MirrorPlan` instead of
+                making changes.
+            typecast(``boolean``): Automatic data conversion from string values.
         Keyword Args:
             max_records (``int``, optional): The maximum total number of
                 records that will be returned. See :any:`MaxRecordsParameter`
             view (``str``, optional): The name or ID of a view.
                 See :any:`ViewParameter`.
         Returns:
-            records (``tuple``): (new_records, deleted_records)
+            records (``tuple``): (new_records, deleted_records), or a
+                ``MirrorResult`` if ``key_field`` is provided.
         """
+        plan = self.plan_mirror_in_table(
+            table_name, records, key_field=key_field, **options
+        )
+        if dry_run:
+            return plan
 
-        all_record_ids = [r["id"] for r in self.get_all(table_name, **options)]
-        deleted_records = self.batch_delete_in_table(table_name, all_record_ids)
-        new_records = self.batch_insert_in_table(table_name, records)
-        return (new_records, deleted_records)
+        deleted_records = self.batch_delete_in_table(table_name, plan.deletes)
+        new_records = self.batch_insert_in_table(
+            table_name, plan.inserts, typecast=typecast
+        )
+        if key_field is None:
+            return (new_records, deleted_records)
+        updated_records = self.batch_update_in_table(
+            table_name, plan.updates, typecast=typecast
+        )
+        return MirrorResult(new_records, updated_records, deleted_records)
 
 
 class Airtable(AirtableBase):
 
-    def __init__(self, base_key, table_name, api_key=None):
+    def __init__(self, base_key, table_name, api_key=None, **kwargs):
         """
         If api_key is not provided, :any:`AirtableAuth` will attempt
         to use ``os.environ['AIRTABLE_API_KEY']``
+
+        Other keyword arguments are passed to :any:`AirtableBase`.
         """
-        super().__init__(base_key, api_key=api_key)
+        super().__init__(base_key, api_key=api_key, **kwargs)
         self.table_name = table_name
 
         # the 2 lines below are not really needed but kept just for passing tests
@@ -577,6 +1469,32 @@ class Airtable(AirtableBase):
         """
         return self.get_in_table(self.table_name, record_id)
 
+    def get_many(self, record_ids, **options):
+        """
+        Retrieves records by their ids, with ``OR(RECORD_ID()=...)`` formulas
+        of up to ``MAX_FORMULA_LENGTH`` characters instead of one request per
+        record. Records in ``record_cache`` are not requested, unless
+        ``fields`` are given.
+
+        >>> airtable.get_many(['rec1', 'rec2'])
+        GetManyResult(records=[{'id': 'rec1', ...}], missing=['rec2'])
+
+        Args:
+            record_ids(``list``): Airtable record ids
+
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParam`.
+            fields (``str``, ``list``, optional): Name of field or fields to
+                be retrieved. Default is all fields. See :any:`FieldsParam`.
+
+        Returns:
+            result (``GetManyResult``): ``records`` in the order of
+                ``record_ids``, and ``missing`` record ids
+
+        """
+        return self.get_many_in_table(self.table_name, record_ids, **options)
+
     def get_iter(self, **options):
         """
         Record Retriever Iterator
@@ -589,6 +1507,19 @@ class Airtable(AirtableBase):
         ...         print(record)
         [{'fields': ... }, ...]
 
+        Linked records can be retrieved with the records, in batches:
+
+        >>> expand = {
+        ...     'Customer': {
+        ...         'table': 'Customers',
+        ...         'fields': ['Name'],
+        ...         'expand': {'Account': 'Accounts'},
+        ...     }
+        ... }
+        >>> for page in airtable.get_iter(expand=expand):
+        ...     customer = page[0]['fields']['Customer'][0]
+        ...     account = customer['fields']['Account'][0]['fields']
+
         Keyword Args:
             max_records (``int``, optional): The maximum total number of
                 records that will be returned. See :any:`MaxRecordsParam`
@@ -603,6 +1534,19 @@ class Airtable(AirtableBase):
                 Default order is ascending. See :any:`SortParam`.
             formula (``str``, optional): Airtable formula.
                 See :any:`FormulaParam`.
+            prefetch (``int``, optional): Number of pages fetched ahead on
+                a background thread while the current page is processed.
+                Default is 0, pages are fetched when requested.
+            expand (``dict``, optional): Linked record fields to replace with
+                the linked records, by field name. Values are a table name,
+                or a dict with ``table``, and optional ``fields`` and nested
+                ``expand`` keys. Linked records are retrieved in batches and
+                only once per scan.
+            compact (``bool``, optional): Returns :any:`Record` objects,
+                which use less memory than dicts. Default is False.
+            lazy (``bool``, optional): Returns :any:`Record` objects which
+                only decode their fields when they are accessed.
+                Default is False.
 
         Returns:
             iterator (``list``): List of Records, grouped by pageSize
@@ -610,6 +1554,30 @@ class Airtable(AirtableBase):
         """
         return self.get_iter_in_table(self.table_name, **options)
 
+    def iter_records(self, limit=None, **options):
+        """
+        Record Iterator
+
+        Yields records one at a time, fetching pages as they are needed.
+        No more pages are requested once the iterator is closed or
+        ``limit`` records were returned.
+
+        >>> for record in airtable.iter_records(view='ViewName', limit=5):
+        ...     print(record)
+        {'fields': ... }
+
+        Args:
+            limit(``int``, optional): Maximum number of records to return.
+
+        Keyword Args:
+            See :any:`get_iter`.
+
+        Returns:
+            iterator (``dict``): Records
+
+        """
+        return self.iter_records_in_table(self.table_name, limit=limit, **options)
+
     def get_all(self, **options):
         """
         Retrieves all records repetitively and returns a single list.
@@ -630,6 +1598,11 @@ class Airtable(AirtableBase):
                 Default order is ascending. See :any:`SortParam`.
             formula (``str``, optional): Airtable formula.
                 See :any:`FormulaParam`.
+            expand (``dict``, optional): Linked record fields to replace with
+                the linked records. See :any:`get_iter`.
+                Results are not kept in ``query_cache``.
+            compact, lazy (``bool``, optional): Returns :any:`Record` objects.
+                See :any:`get_iter`. Results are not kept in ``query_cache``.
 
         Returns:
             records (``list``): List of Records
@@ -641,7 +1614,8 @@ class Airtable(AirtableBase):
 
     def match(self, field_name, field_value, **options):
         """
-        Returns first match found in :any:`get_all`
+        Returns first match found in :any:`get_all`.
+        Only one record is requested, in a single request.
 
         >>> airtable.match('Name', 'John')
         {'fields': {'Name': 'John'} }
@@ -651,8 +1625,6 @@ class Airtable(AirtableBase):
             field_value (``str``): Value of field to match.
 
         Keyword Args:
-            max_records (``int``, optional): The maximum total number of
-                records that will be returned. See :any:`MaxRecordsParam`
             view (``str``, optional): The name or ID of a view.
                 See :any:`ViewParam`.
             fields (``str``, ``list``, optional): Name of field or fields to
@@ -693,6 +1665,64 @@ class Airtable(AirtableBase):
 
         return self.search_in_table(self.table_name, field_name, field_value, **options)
 
+    def search_many(self, field_name, field_values, **options):
+        """
+        Returns records matching each of ``field_values``. Values are looked
+        up with ``OR()`` formulas of up to ``MAX_FORMULA_LENGTH`` characters,
+        instead of one query per value.
+
+        >>> airtable.search_many('Name', ['John', 'Marc'])
+        OrderedDict([('John', [{'id': ...}]), ('Marc', [])])
+
+        Args:
+            field_name (``str``): Name of field to match (column name).
+            field_values (``list``): Values of field to match.
+
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParam`.
+            fields (``str``, ``list``, optional): Name of field or fields to
+                be retrieved. ``field_name`` is always retrieved.
+                See :any:`FieldsParam`.
+            sort (``list``, optional): List of fields to sort by.
+                Default order is ascending. See :any:`SortParam`.
+
+        Returns:
+            records (``OrderedDict``): Matching records by value,
+                in the order of ``field_values``
+
+        """
+        return self.search_many_in_table(
+            self.table_name, field_name, field_values, **options
+        )
+
+    def match_many(self, field_name, field_values, **options):
+        """
+        Returns the first record to match each of ``field_values``, or ``{}``.
+        See :any:`search_many`.
+
+        >>> airtable.match_many('Name', ['John', 'Marc'])
+        OrderedDict([('John', {'id': ...}), ('Marc', {})])
+
+        Args:
+            field_name (``str``): Name of field to match (column name).
+            field_values (``list``): Values of field to match.
+
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParam`.
+            fields (``str``, ``list``, optional): Name of field or fields to
+                be retrieved. ``field_name`` is always retrieved.
+                See :any:`FieldsParam`.
+
+        Returns:
+            records (``OrderedDict``): First matching record by value
+
+        """
+        return self.match_many_in_table(
+            self.table_name, field_name, field_values, **options
+        )
+
     def insert(self, fields, typecast=False):
         """
         Inserts a record
@@ -713,7 +1743,8 @@ class Airtable(AirtableBase):
 
     def batch_insert(self, records, typecast=False):
         """
-        Calls :any:`insert` repetitively, following set API Rate Limit (5/sec)
+        Inserts records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        records per request, following set API Rate Limit (5/sec)
         To change the rate limit use ``airtable.API_LIMIT = 0.2``
         (5 per second)
 
@@ -750,6 +1781,26 @@ class Airtable(AirtableBase):
         """
         return self.update_in_table(self.table_name, record_id, fields, typecast=typecast)
 
+    def batch_update(self, records, typecast=False):
+        """
+        Updates records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        records per request, following set API Rate Limit (5/sec).
+        Only Fields passed are updated, the rest are left as is.
+
+        >>> records = [{'id': 'recwPQIfs4wKPyc9D', 'fields': {'Status': 'Fired'}}]
+        >>> airtable.batch_update(records)
+
+        Args:
+            records(``list``): Records to update. Each record must be a
+                dictionary with ``id`` and ``fields`` keys.
+            typecast(``boolean``): Automatic data conversion from string values.
+
+        Returns:
+            records (``list``): list of updated records
+
+        """
+        return self.batch_update_in_table(self.table_name, records, typecast=typecast)
+
     def update_by_field(
         self, field_name, field_value, fields, typecast=False, **options
     ):
@@ -778,6 +1829,39 @@ class Airtable(AirtableBase):
         """
         return self.update_by_field_in_table(self.table_name, field_name, field_value, fields, typecast=typecast, **options)
 
+    def batch_upsert(self, records, key_fields, typecast=False, **options):
+        """
+        Updates records matching the values of ``key_fields``, and inserts
+        the others. Existing records are retrieved once, with only the key
+        fields, instead of a match per record.
+
+        >>> records = [{'Email': 'john@example.com', 'Name': 'John'}]
+        >>> airtable.batch_upsert(records, 'Email')
+        UpsertResult(created=[...], updated=[...])
+
+        Args:
+            records(``list``): Fields of the records to upsert
+            key_fields(``str``, ``list``): Name of field or fields used to
+                match records.
+            typecast(``boolean``): Automatic data conversion from string values.
+
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+                See :any:`ViewParam`.
+            formula (``str``, optional): Airtable formula.
+                See :any:`FormulaParam`.
+
+        Raises:
+            ValueError: If two records have the same key, or a key matches
+                more than one existing record.
+
+        Returns:
+            result (``UpsertResult``): ``created`` and ``updated`` records
+        """
+        return self.batch_upsert_in_table(
+            self.table_name, records, key_fields, typecast=typecast, **options
+        )
+
     def replace(self, record_id, fields, typecast=False):
         """
         Replaces a record by its record id.
@@ -800,6 +1884,26 @@ class Airtable(AirtableBase):
         """
         return self.replace_in_table(self.table_name, record_id, fields, typecast=typecast)
 
+    def batch_replace(self, records, typecast=False):
+        """
+        Replaces records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        records per request, following set API Rate Limit (5/sec).
+        If a field is not included in ``fields``, value will bet set to null.
+
+        >>> records = [{'id': 'recwPQIfs4wKPyc9D', 'fields': {'Name': 'Mike'}}]
+        >>> airtable.batch_replace(records)
+
+        Args:
+            records(``list``): Records to replace. Each record must be a
+                dictionary with ``id`` and ``fields`` keys.
+            typecast(``boolean``): Automatic data conversion from string values.
+
+        Returns:
+            records (``list``): list of new records
+
+        """
+        return self.batch_replace_in_table(self.table_name, records, typecast=typecast)
+
     def replace_by_field(
         self, field_name, field_value, fields, typecast=False, **options
     ):
@@ -869,7 +1973,8 @@ class Airtable(AirtableBase):
 
     def batch_delete(self, record_ids):
         """
-        Calls :any:`delete` repetitively, following set API Rate Limit (5/sec)
+        Deletes records in chunks of ``MAX_RECORDS_PER_REQUEST`` (10)
+        record ids per request, following set API Rate Limit (5/sec)
         To change the rate limit set value of ``airtable.API_LIMIT`` to
         the time in seconds it should sleep before calling the function again.
 
@@ -885,7 +1990,7 @@ class Airtable(AirtableBase):
         """
         return self.batch_delete_in_table(self.table_name, record_ids)
 
-    def mirror(self, records, **options):
+    def mirror(self, records, key_field=None, dry_run=False, typecast=False, **options):
         """
         Deletes all records on table or view and replaces with records.
 
@@ -899,8 +2004,20 @@ class Airtable(AirtableBase):
         >>> record = airtable.mirror(records, view='View')
         ([{'id': 'recwPQIfs4wKPyc9D', ... }], [{'deleted': True, ... }])
 
+        If ``key_field`` is provided, only the changes are sent.
+        See :any:`mirror_in_table`.
+
+        >>> plan = airtable.mirror(records, key_field='Name', dry_run=True)
+        >>> plan.request_count
+        1
+
         Args:
             records(``list``): Records to insert
+            key_field(``str``, ``list``, optional): Name of field or fields
+                used to match records.
+            dry_run(``boolean``): Return the :any:`MirrorPlan` instead of
+                making changes.
+            typecast(``boolean``): Automatic data conversion from string values.
 
         Keyword Args:
             max_records (``int``, optional): The maximum total number of
@@ -909,10 +2026,18 @@ class Airtable(AirtableBase):
                 See :any:`ViewParam`.
 
         Returns:
-            records (``tuple``): (new_records, deleted_records)
+            records (``tuple``): (new_records, deleted_records), or a
+                ``MirrorResult`` if ``key_field`` is provided.
         """
 
-        return self.mirror_in_table(self.table_name, records, **options)
+        return self.mirror_in_table(
+            self.table_name,
+            records,
+            key_field=key_field,
+            dry_run=dry_run,
+            typecast=typecast,
+            **options
+        )
 
     def __repr__(self):
         return "<Airtable table:{}>".format(self.table_name)
@@ -0,0 +1,281 @@
+"""
+Records retrieved with :any:`get` can be kept in an in-process
+:any:`RecordCache`, so repeated calls for the same record do not count
+against the API rate limit.
+
+>>> cache = RecordCache(max_size=5000, ttl=60)
+>>> airtable = Airtable(base_key, table_name, record_cache=cache)
+>>> airtable.get('recwPQIfs4wKPyc9D')  # Request
+>>> airtable.get('recwPQIfs4wKPyc9D')  # Cached
+
+Records updated, replaced or deleted through the same client are refreshed
+or removed from the cache. Changes made by other clients are only seen once
+the cached record expires.
+
+>>> cache.stats
+{'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'size_bytes': 120}
+
+Results of :any:`get_all` and :any:`search` can be kept in a
+:any:`QueryCache`, keyed by table and query parameters:
+
+>>> cache = QueryCache(ttl=30, stale_ttl=300)
+>>> airtable = Airtable(base_key, table_name, query_cache=cache)
+>>> airtable.get_all(view='Dashboard')  # Request
+>>> airtable.get_all(view='Dashboard')  # Cached
+
+Once a result is older than ``ttl`` but not ``ttl + stale_ttl``, the cached
+result is returned and refreshed on a background thread. All results of a
+table are removed when the same client writes to the table.
+
+"""  #
+from __future__ import absolute_import
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class RecordCache(object):
+    def __init__(self, max_size=1000, ttl=60.0, max_bytes=None):
+        """
+        Least recently used cache of records, with expiration.
+
+        Records are stored as JSON strings, so each ``get`` returns a new
+        copy and the memory used can be bounded.
+
+        Args:
+            max_size (``int``): Maximum number of records. Default is 1000.
+            ttl (``float``): Seconds before a record expires.
+                Default is 60. ``None`` to never expire.
+            max_bytes (``int``, optional): Maximum total size of the
+                stored records, in characters of JSON.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+        self._records = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _pop(self, key):
+        _, data = self._records.pop(key)
+        self.size_bytes -= len(data)
+
+    def get(self, table_name, record_id):
+        """ Returns the cached record, or ``None`` """
+        key = (table_name, record_id)
+        with self._lock:
+            try:
+                expires, data = self._records[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if expires is not None and expires <= time.monotonic():
+                self._pop(key)
+                self.misses += 1
+                return None
+            self._records.move_to_end(key)
+            self.hits += 1
+        return json.loads(data)
+
+    def set(self, table_name, record):
+        """ Adds or refreshes a record, evicting least recently used ones """
+        key = (table_name, record["id"])
+        data = json.dumps(record)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._records:
+                self._pop(key)
+            if self.max_bytes is not None and len(data) > self.max_bytes:
+                return
+            self._records[key] = (expires, data)
+            self.size_bytes += len(data)
+            while len(self._records) > self.max_size or (
+                self.max_bytes is not None and self.size_bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._records)))
+                self.evictions += 1
+
+    def invalidate(self, table_name, record_id):
+        """ Removes a record from the cache """
+        with self._lock:
+            if (table_name, record_id) in self._records:
+                self._pop((table_name, record_id))
+
+    def clear(self):
+        """ Removes all records """
+        with self._lock:
+            self._records.clear()
+            self.size_bytes = 0
+
+    @property
+    def stats(self):
+        """ Returns hits, misses, evictions, size and size_bytes """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._records),
+                "size_bytes": self.size_bytes,
+            }
+
+    def __len__(self):
+        return len(self._records)
+
+    def __repr__(self):
+        return "<RecordCache size:{} hits:{} misses:{}>".format(
+            len(self._records), self.hits, self.misses
+        )
+
+
+class QueryCache(object):
+    def __init__(self, max_entries=100, ttl=30.0, stale_ttl=0.0, max_bytes=None):
+        """
+        Least recently used cache of query results, with expiration and
+        stale-while-revalidate.
+
+        Args:
+            max_entries (``int``): Maximum number of results. Default is 100.
+            ttl (``float``): Seconds a result is fresh. Default is 30.
+            stale_ttl (``float``): Seconds an expired result is still
+                returned while it is refreshed in the background.
+                Default is 0.
+            max_bytes (``int``, optional): Maximum total size of the
+                stored results, in characters of JSON.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+        # key -> [fetched_time, data, refreshing]
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(table_name, params):
+        """ Returns a hashable key from table name and processed params """
+        items = []
+        for name, value in params.items():
+            if isinstance(value, list):
+                value = tuple(value)
+            items.append((name, value))
+        return (table_name, tuple(sorted(items)))
+
+    def _pop(self, key):
+        _, data, _ = self._entries.pop(key)
+        self.size_bytes -= len(data)
+
+    def _store(self, key, records, generation):
+        data = json.dumps(records)
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                # Table was written to while the records were loaded
+                return
+            if key in self._entries:
+                self._pop(key)
+            if self.max_bytes is not None and len(data) > self.max_bytes:
+                return
+            self._entries[key] = [time.monotonic(), data, False]
+            self.size_bytes += len(data)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size_bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _refresh(self, key, loader, generation):
+        try:
+            self._store(key, loader(), generation)
+        finally:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry[2] = False
+
+    def get(self, key, loader):
+        """
+        Returns the cached records for ``key``, calling ``loader`` to get
+        them if they are missing or expired.
+        """
+        refresh = False
+        with self._lock:
+            generation = self._generations.get(key[0], 0)
+            entry = self._entries.get(key)
+            if entry is not None:
+                fetched_time, data, refreshing = entry
+                age = time.monotonic() - fetched_time
+                if age < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(data)
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    refresh = not refreshing
+                    entry[2] = True
+                else:
+                    self._pop(key)
+                    entry = None
+            if entry is None:
+                self.misses += 1
+
+        if entry is None:
+            records = loader()
+            self._store(key, records, generation)
+            return records
+
+        if refresh:
+            thread = threading.Thread(
+                target=self._refresh, args=(key, loader, generation)
+            )
+            thread.daemon = True
+            thread.start()
+        return json.loads(data)
+
+    def invalidate_table(self, table_name):
+        """ Removes all results of a table """
+        with self._lock:
+            self._generations[table_name] = self._generations.get(table_name, 0) + 1
+            for key in [key for key in self._entries if key[0] == table_name]:
+                self._pop(key)
+
+    def clear(self):
+        """ Removes all results """
+        with self._lock:
+            for table_name in set(key[0] for key in self._entries):
+                self._generations[table_name] = (
+                    self._generations.get(table_name, 0) + 1
+                )
+            self._entries.clear()
+            self.size_bytes = 0
+
+    @property
+    def stats(self):
+        """ Returns hits, stale_hits, misses, evictions, size and size_bytes """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "size_bytes": self.size_bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return "<QueryCache size:{} hits:{} misses:{}>".format(
+            len(self._entries), self.hits, self.misses
+        )
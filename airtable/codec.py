@@ -0,0 +1,167 @@
+"""
+Request and response bodies are encoded and decoded by a JSON codec.
+By default the fastest installed library is used, in this order:
+`orjson <https://github.com/ijl/orjson>`_,
+`ujson <https://github.com/ultrajson/ultrajson>`_, then the ``json`` module.
+
+>>> airtable = Airtable(base_key, table_name)
+>>> airtable.codec
+<OrjsonCodec>
+
+A codec can be chosen by name:
+
+>>> airtable = Airtable(base_key, table_name, codec=get_codec('json'))
+
+Codecs encode and decode the same values as the ``json`` module, except
+that ``orjson`` also encodes UUIDs and enums. Values a library would handle
+differently fall back to the ``json`` module: integers larger than 64 bits,
+``NaN``, dates, and strings with lone surrogates, which are sent escaped.
+
+"""  #
+from __future__ import absolute_import
+import json
+import math
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+# Number tokens of 19 digits or more may not fit in 64 bits. Numbers follow
+# ":", "[" or ",", so digits inside most strings do not match.
+_LONG_NUMBER = re.compile(r"[:\[,]\s*-?\d{19}")
+_LONG_NUMBER_BYTES = re.compile(rb"[:\[,]\s*-?\d{19}")
+
+if orjson is not None:
+    # Types the json module cannot encode are passed to the fallback
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _has_long_number(data):
+    pattern = _LONG_NUMBER if isinstance(data, str) else _LONG_NUMBER_BYTES
+    return pattern.search(data) is not None
+
+
+def _has_non_finite(obj):
+    """ Returns True if obj holds a NaN or infinite float """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+class JSONCodec(object):
+    """ Codec of the ``json`` module, and base class of codecs """
+
+    name = "json"
+
+    def dumps(self, obj):
+        """ Returns obj encoded as UTF-8 JSON bytes """
+        text = json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        )
+        try:
+            return text.encode("utf-8")
+        except UnicodeEncodeError:
+            # Lone surrogates can only be sent escaped
+            return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode(
+                "utf-8"
+            )
+
+    def loads(self, data):
+        """ Returns the value of JSON ``bytes`` or ``str`` """
+        return json.loads(data)
+
+    def __repr__(self):
+        return "<{}>".format(self.__class__.__name__)
+
+
+class OrjsonCodec(JSONCodec):
+
+    name = "orjson"
+
+    def dumps(self, obj):
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return JSONCodec.dumps(self, obj)
+        # orjson encodes NaN and infinity as null, json raises ValueError
+        if b"null" in data and _has_non_finite(obj):
+            return JSONCodec.dumps(self, obj)
+        return data
+
+    def loads(self, data):
+        # orjson decodes integers larger than 64 bits as floats
+        if _has_long_number(data):
+            return JSONCodec.loads(self, data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return JSONCodec.loads(self, data)
+
+
+class UjsonCodec(JSONCodec):
+
+    name = "ujson"
+
+    def dumps(self, obj):
+        try:
+            text = ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+        except (TypeError, OverflowError, UnicodeEncodeError):
+            return JSONCodec.dumps(self, obj)
+        if ("NaN" in text or "Infinity" in text) and _has_non_finite(obj):
+            return JSONCodec.dumps(self, obj)
+        try:
+            return text.encode("utf-8")
+        except UnicodeEncodeError:
+            return JSONCodec.dumps(self, obj)
+
+    def loads(self, data):
+        if _has_long_number(data):
+            return JSONCodec.loads(self, data)
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            return JSONCodec.loads(self, data)
+
+
+CODECS = [
+    (OrjsonCodec, orjson),
+    (UjsonCodec, ujson),
+    (JSONCodec, json),
+]
+
+
+def get_codec(name=None):
+    """
+    Returns a codec by name, or the fastest codec installed.
+
+    Args:
+        name (``str``, optional): ``orjson``, ``ujson`` or ``json``.
+
+    Raises:
+        ImportError: If the library of the codec is not installed.
+        ValueError: If there is no codec with this name.
+    """
+    for codec_class, module in CODECS:
+        if name is None and module is None:
+            continue
+        if name is None or name == codec_class.name:
+            if module is None:
+                raise ImportError("{} is not installed".format(name))
+            return codec_class()
+    raise ValueError("invalid codec name {}".format(name))
@@ -0,0 +1,278 @@
+"""
+Records of a scan can be converted to columns one page at a time, so
+analytics jobs do not hold all the records as dicts:
+
+>>> for batch in iter_batches(airtable, columns=['Name', 'Amount']):
+...     total += pyarrow.compute.sum(batch.column('Amount')).as_py()
+
+Batches are ``pyarrow.RecordBatch`` objects, or ``OrderedDict`` of
+``numpy.ma.MaskedArray`` by column name when ``pyarrow`` is not installed.
+Empty cells are nulls in Arrow and masked values in NumPy. Each batch has an
+``id`` column with the record ids.
+
+Columns are required, since Airtable omits empty fields from records and
+the first page may not have every field. Column types are given with
+``schema``, or inferred from the first page:
+
+>>> schema = {'Name': 'str', 'Amount': 'float', 'Done': 'bool', 'Tags': 'json'}
+>>> batches = iter_batches(airtable, schema=schema, view='Open')
+
+Types are ``str``, ``float``, ``int``, ``bool``, and ``json`` for lists and
+objects like linked records or attachments, stored as JSON strings.
+Values that do not fit the type of their column, like a list in a ``str``
+column, an error in a ``float`` column or a decimal in an ``int`` column,
+are nulls. Columns without values in the first page are inferred as ``str``,
+so pass a ``schema`` for sparse fields.
+
+Batches can be streamed to a Parquet file, with ``pyarrow``:
+
+>>> write_parquet(airtable, 'orders.parquet', schema=schema)
+12000
+
+"""  #
+from __future__ import absolute_import
+import json
+from collections import OrderedDict
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+TYPES = ("str", "float", "int", "bool", "json")
+
+
+def _to_str(value):
+    return value if isinstance(value, str) else None
+
+
+def _to_float(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _to_int(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None
+    return value
+
+
+def _to_bool(value):
+    return value if isinstance(value, bool) else None
+
+
+def _to_json(value):
+    return json.dumps(value, separators=(",", ":"))
+
+
+_CONVERTERS = {
+    "str": _to_str,
+    "float": _to_float,
+    "int": _to_int,
+    "bool": _to_bool,
+    "json": _to_json,
+}
+
+
+def _infer_type(value):
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        # Number fields can have decimals in later pages
+        return "float"
+    if isinstance(value, (list, dict)):
+        return "json"
+    return "str"
+
+
+def infer_schema(records, columns=None):
+    """
+    Returns the type of each column from the first value of the column
+    in records. Columns without values are ``str``.
+
+    Args:
+        records (``list``): Records
+        columns (``list``, optional): Column names.
+            Default is the fields of the records, in order of appearance.
+    """
+    if columns is None:
+        columns = OrderedDict()
+        for record in records:
+            columns.update((name, None) for name in record["fields"])
+    schema = OrderedDict()
+    for column in columns:
+        schema[column] = "str"
+        for record in records:
+            value = record["fields"].get(column)
+            if value is not None:
+                schema[column] = _infer_type(value)
+                break
+    return schema
+
+
+def to_columns(records, schema):
+    """
+    Returns an ``OrderedDict`` of the values of each column, converted to
+    the column type, with the record ids in the ``id`` column. Empty cells
+    and values that do not fit the column type are ``None``, except
+    unchecked checkboxes, which are ``False``.
+    """
+    columns = OrderedDict([("id", [record["id"] for record in records])])
+    for column, column_type in schema.items():
+        convert = _CONVERTERS[column_type]
+        values = []
+        for record in records:
+            value = record["fields"].get(column)
+            if value is None and column_type == "bool":
+                value = False
+            values.append(None if value is None else convert(value))
+        columns[column] = values
+    return columns
+
+
+def _arrow_type(column_type):
+    return {
+        "str": pyarrow.string(),
+        "float": pyarrow.float64(),
+        "int": pyarrow.int64(),
+        "bool": pyarrow.bool_(),
+        "json": pyarrow.string(),
+    }[column_type]
+
+
+def arrow_schema(schema):
+    """ Returns the ``pyarrow.Schema`` of batches with ``schema`` """
+    fields = [pyarrow.field("id", pyarrow.string(), nullable=False)]
+    fields.extend(
+        pyarrow.field(column, _arrow_type(column_type))
+        for column, column_type in schema.items()
+    )
+    return pyarrow.schema(fields)
+
+
+def _to_arrow(columns, schema):
+    arrays = [
+        pyarrow.array(values, type=field.type)
+        for field, values in zip(schema, columns.values())
+    ]
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _to_numpy(columns, schema):
+    dtypes = {"float": "float64", "int": "int64", "bool": "bool"}
+    fill_values = {"float": 0.0, "int": 0, "bool": False}
+    batch = OrderedDict()
+    for column, values in columns.items():
+        column_type = schema.get(column, "str")
+        mask = [value is None for value in values]
+        fill_value = fill_values.get(column_type)
+        data = [fill_value if value is None else value for value in values]
+        batch[column] = numpy.ma.masked_array(
+            numpy.array(data, dtype=dtypes.get(column_type, object)), mask=mask
+        )
+    return batch
+
+
+def iter_batches(
+    airtable, columns=None, schema=None, table_name=None, backend=None, **options
+):
+    """
+    Yields a columnar batch for each page of records.
+
+    Args:
+        airtable (``AirtableBase``): Client used to retrieve records.
+        columns (``list``, optional): Fields to convert, and retrieve.
+            Default is the columns of ``schema``.
+        schema (``dict``, optional): Type of each column, by name.
+            Default is inferred from the first page.
+            Either ``columns`` or ``schema`` is required.
+        table_name (``str``, optional): Airtable table name.
+            Default is the table of an :any:`Airtable` client.
+        backend (``str``, optional): ``arrow`` or ``numpy``.
+            Default is ``arrow`` if ``pyarrow`` is installed.
+
+    Keyword Args:
+        view, formula, sort, page_size: See :any:`get_iter`.
+
+    Returns:
+        iterator: ``pyarrow.RecordBatch`` or ``OrderedDict`` of
+            ``numpy.ma.MaskedArray``
+
+    Raises:
+        ValueError: If neither ``columns`` nor ``schema`` is given.
+    """
+    if columns is None and schema is None:
+        raise ValueError("columns or schema is required")
+    if schema is not None:
+        columns = list(schema) if columns is None else columns
+        schema = OrderedDict((c, schema.get(c, "str")) for c in columns)
+        for column, column_type in schema.items():
+            if column_type not in TYPES:
+                raise ValueError(
+                    "invalid type of column {}: {}".format(column, column_type)
+                )
+    if columns is not None:
+        options.setdefault("fields", list(columns))
+
+    if backend is None:
+        backend = "arrow" if pyarrow is not None else "numpy"
+    if backend == "arrow" and pyarrow is None:
+        raise ImportError("arrow batches require pyarrow to be installed")
+    if backend == "numpy" and numpy is None:
+        raise ImportError("numpy batches require numpy to be installed")
+
+    table_name = table_name or airtable.table_name
+    arrow = None
+    for records in airtable.get_iter_in_table(table_name, **options):
+        if schema is None:
+            schema = infer_schema(records, columns)
+        data = to_columns(records, schema)
+        if backend == "arrow":
+            arrow = arrow or arrow_schema(schema)
+            yield _to_arrow(data, arrow)
+        else:
+            yield _to_numpy(data, schema)
+
+
+def write_parquet(airtable, path, columns=None, schema=None, **options):
+    """
+    Writes the records of a table to a Parquet file, one row group per
+    page. Requires ``pyarrow``.
+
+    Args:
+        airtable (``AirtableBase``): Client used to retrieve records.
+        path (``str``): Path of the Parquet file.
+        columns, schema: See :any:`iter_batches`.
+
+    Keyword Args:
+        table_name, view, formula, sort: See :any:`iter_batches`.
+
+    Returns:
+        count (``int``): Number of rows written
+    """
+    if pyarrow is None:
+        raise ImportError("write_parquet requires pyarrow to be installed")
+    from pyarrow import parquet
+
+    count = 0
+    writer = None
+    try:
+        for batch in iter_batches(
+            airtable, columns=columns, schema=schema, backend="arrow", **options
+        ):
+            if writer is None:
+                writer = parquet.ParquetWriter(path, batch.schema)
+            writer.write_batch(batch)
+            count += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
@@ -0,0 +1,219 @@
+"""
+A :any:`ScanCursor` iterates over the pages of a table like
+:any:`get_iter`, but exposes the offset of the next page, so a long scan
+can be resumed after it stopped.
+
+>>> cursor = ScanCursor(airtable, view='All')
+>>> for page in cursor:
+...     export(page)
+...     saved_offset, saved_records = cursor.offset, cursor.records
+>>> cursor = ScanCursor(
+...     airtable, offset=saved_offset, records=saved_records, view='All'
+... )
+
+With ``checkpoint``, the state of the cursor is written to a file every
+``checkpoint_every`` pages, once the previous pages were processed, and
+read back when the cursor is created. The file is removed once the scan
+is complete.
+
+>>> cursor = ScanCursor(airtable, checkpoint='export.json', checkpoint_every=10)
+>>> for page in cursor:  # Resumes from export.json if it exists
+...     export(page)
+
+Offsets expire a few minutes after they were returned. When an offset has
+expired, the scan is restarted from the first page. If ``resume_field`` is
+set, to a field with increasing unique values like an autonumber, the scan
+is sorted by it, and restarts with a formula that only matches the records
+after the last one returned with a value. Otherwise the records already
+returned are skipped. A cursor created with an ``offset`` and without a
+checkpoint only knows how many records to skip if ``records`` is given;
+otherwise the expired offset error is raised.
+
+"""  #
+from __future__ import absolute_import
+import json
+import os
+
+import requests
+
+EXPIRED_OFFSET_ERROR = "LIST_RECORDS_ITERATOR_NOT_AVAILABLE"
+
+
+class ScanCursor(object):
+    def __init__(
+        self,
+        airtable,
+        table_name=None,
+        offset=None,
+        checkpoint=None,
+        checkpoint_every=1,
+        resume_field=None,
+        records=None,
+        **options
+    ):
+        """
+        Resumable iterator over the pages of a table.
+
+        Args:
+            airtable (``AirtableBase``): Client used to retrieve records.
+            table_name (``str``, optional): Airtable table name.
+                Default is the table of an :any:`Airtable` client.
+            offset (``str``, optional): Offset of the first page to retrieve.
+            checkpoint (``str``, optional): Path of the checkpoint file.
+            checkpoint_every (``int``): Pages between checkpoints.
+                Default is 1.
+            resume_field (``str``, optional): Field with increasing unique
+                values, used to restart a scan after its offset expired.
+            records (``int``, optional): Records returned before ``offset``,
+                skipped if the scan is restarted.
+
+        Keyword Args:
+            view, formula, fields, page_size: See :any:`get_iter`.
+        """
+        self.airtable = airtable
+        self.table_name = table_name or airtable.table_name
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.resume_field = resume_field
+        if resume_field is not None:
+            options["sort"] = [resume_field]
+            fields = options.get("fields")
+            if fields and resume_field not in fields:
+                if hasattr(fields, "startswith"):
+                    fields = [fields]
+                options["fields"] = list(fields) + [resume_field]
+        self.options = options
+
+        self.offset = offset
+        self.pages = 0
+        self.records = records or 0
+        # Whether the records before the offset can be skipped on a restart
+        self.position_known = offset is None or records is not None
+        self.resume_value = None
+        self.restarts = 0
+        self.done = False
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self._load()
+
+    def state(self):
+        """ Returns the state of the cursor, as saved in checkpoints """
+        return {
+            "table_name": self.table_name,
+            "offset": self.offset,
+            "pages": self.pages,
+            "records": self.records,
+            "resume_value": self.resume_value,
+        }
+
+    def _load(self):
+        with open(self.checkpoint) as checkpoint:
+            state = json.load(checkpoint)
+        if state["table_name"] != self.table_name:
+            raise ValueError(
+                "checkpoint {} is for table {}".format(
+                    self.checkpoint, state["table_name"]
+                )
+            )
+        self.offset = state["offset"]
+        self.pages = state["pages"]
+        self.records = state["records"]
+        self.resume_value = state["resume_value"]
+        self.position_known = True
+
+    def save(self):
+        """ Writes the state of the cursor to the checkpoint file """
+        temp_path = self.checkpoint + ".tmp"
+        with open(temp_path, "w") as checkpoint:
+            json.dump(self.state(), checkpoint)
+        os.replace(temp_path, self.checkpoint)
+
+    def _resume_formula(self):
+        """ Returns the formula matching records after the last one returned """
+        value = self.resume_value
+        if isinstance(value, str):
+            value = "'{}'".format(value.replace("'", "\\'"))
+        formula = "{{{}}}>{}".format(self.resume_field, value)
+        base_formula = self.options.get("formula") or self.options.get(
+            "filterByFormula"
+        )
+        if base_formula:
+            formula = "AND({}, {})".format(base_formula, formula)
+        return formula
+
+    def _responses(self, offset):
+        options = dict(self.options)
+        if self.resume_value is not None and offset is None:
+            options.pop("filterByFormula", None)
+            options["formula"] = self._resume_formula()
+        return self.airtable._iter_responses(self.table_name, offset=offset, **options)
+
+    def _can_restart(self):
+        if self.resume_field is not None and self.resume_value is not None:
+            return True
+        return self.position_known
+
+    def _restart(self):
+        """
+        Restarts the scan from the first page after the offset expired.
+        Returns the number of records to skip.
+        """
+        self.restarts += 1
+        self.offset = None
+        if self.resume_field is not None and self.resume_value is not None:
+            return 0
+        return self.records
+
+    def _update_resume_value(self, records):
+        """ Keeps the last value of ``resume_field``, skipping empty cells """
+        for record in reversed(records):
+            value = record["fields"].get(self.resume_field)
+            if value is not None:
+                self.resume_value = value
+                return
+
+    def __iter__(self):
+        if self.done:
+            return
+        skip = 0
+        responses = self._responses(self.offset)
+        while True:
+            try:
+                data = next(responses)
+            except StopIteration:
+                break
+            except requests.exceptions.HTTPError as exc:
+                if self.offset is None or EXPIRED_OFFSET_ERROR not in str(exc):
+                    raise
+                if not self._can_restart():
+                    raise
+                skip = self._restart()
+                responses = self._responses(None)
+                continue
+
+            records = data.get("records", [])
+            if skip:
+                skipped = min(skip, len(records))
+                records = records[skipped:]
+                skip -= skipped
+            self.offset = data.get("offset")
+            if records:
+                if self.resume_field is not None:
+                    self._update_resume_value(records)
+                self.pages += 1
+                self.records += len(records)
+                yield records
+                if self.checkpoint is not None and (
+                    self.pages % self.checkpoint_every == 0
+                ):
+                    self.save()
+            if not self.offset:
+                break
+
+        self.done = True
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+    def __repr__(self):
+        return "<ScanCursor table:{} pages:{} records:{}>".format(
+            self.table_name, self.pages, self.records
+        )
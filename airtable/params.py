@@ -26,6 +26,10 @@ class _BaseParam:
     def to_param_dict(self):
         return {self.param_name: self.value}
 
+    def to_body_dict(self):
+        """ Returns param for the JSON body of a ``listRecords`` request """
+        return {self.param_name: self.value}
+
 
 class _BaseStringArrayParam(_BaseParam):
     """
@@ -46,6 +50,10 @@ class _BaseStringArrayParam(_BaseParam):
         encoded_param = self.param_name + "[]"
         return {encoded_param: self.value}
 
+    def to_body_dict(self):
+        value = [self.value] if hasattr(self.value, "startswith") else self.value
+        return {self.param_name: list(value)}
+
 
 class _BaseObjectArrayParam(_BaseParam):
     """
@@ -210,6 +218,36 @@ class AirtableParams:
             formula = "{{{name}}}={value}".format(name=field_name, value=field_value)
             return formula
 
+        @staticmethod
+        def or_chunks(formulas, max_length=2000):
+            """
+            Joins formulas in ``OR()`` formulas, as many as needed to keep
+            each formula under max_length characters.
+            """
+            chunks = []
+            chunk = []
+            length = len("OR()")
+            for formula in formulas:
+                if chunk and length + len(formula) + 1 > max_length:
+                    chunks.append("OR({})".format(",".join(chunk)))
+                    chunk = []
+                    length = len("OR()")
+                chunk.append(formula)
+                length += len(formula) + 1
+            if chunk:
+                chunks.append("OR({})".format(",".join(chunk)))
+            return chunks
+
+        @classmethod
+        def from_name_and_values(cls, field_name, field_values, max_length=2000):
+            """
+            Creates formulas to match cells from field_name and any of
+            field_values, ie ``OR({Name}='A',{Name}='B')``.
+            See :any:`or_chunks`.
+            """
+            formulas = [cls.from_name_and_value(field_name, v) for v in field_values]
+            return cls.or_chunks(formulas, max_length=max_length)
+
     class _OffsetParam(_BaseParam):
         """
         Offset Param
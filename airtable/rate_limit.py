@@ -0,0 +1,135 @@
+"""
+Requests are throttled by a :any:`RateLimiter`, a token bucket that is
+shared by every client of the same base, since Airtable enforces its
+limit of 5 requests per second per base.
+
+A request only waits when the bucket is empty, so requests that are slower
+than the rate limit are never delayed.
+
+>>> airtable = Airtable(base_key, table_name)
+>>> airtable.rate_limiter
+<RateLimiter interval:0.2 burst:1>
+
+To allow short bursts of requests, pass your own limiter:
+
+>>> limiter = RateLimiter(interval=0.2, burst=5)
+>>> airtable = Airtable(base_key, table_name, rate_limiter=limiter)
+
+The limiter owns its interval. ``airtable.API_LIMIT`` is the interval of
+the client's limiter. Setting it gives the client its own limiter, without
+changing the rate of the other clients of the base:
+
+>>> airtable.API_LIMIT = 1.0
+>>> airtable.rate_limiter
+<RateLimiter interval:1.0 burst:1>
+
+"""  #
+from __future__ import absolute_import
+import asyncio
+import threading
+import time
+
+
+class RateLimiter(object):
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, interval=1.0 / 5, burst=1):
+        """
+        Token bucket rate limiter.
+
+        Tokens are added every ``interval`` seconds up to ``burst`` tokens,
+        and each request takes one token. It is safe to share a limiter
+        between threads.
+
+        Args:
+            interval (``float``): Seconds between requests once the
+                bucket is empty. Default is 0.2 (5 per second).
+            burst (``int``): Maximum number of requests that can be
+                sent without waiting. Default is 1.
+        """
+        self.interval = interval
+        self.burst = burst
+        # Theoretical arrival time of the next request, see GCRA
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key, **kwargs):
+        """
+        Returns the limiter registered for ``key``, creating it with
+        ``kwargs`` the first time it is requested.
+        """
+        with cls._shared_lock:
+            try:
+                return cls._shared[key]
+            except KeyError:
+                limiter = cls._shared[key] = cls(**kwargs)
+                return limiter
+
+    def _reserve(self, interval):
+        """ Takes a token and returns the seconds to wait before using it """
+        with self._lock:
+            now = time.monotonic()
+            next_time = max(self._next_time, now)
+            self._next_time = next_time + interval
+            tolerance = (self.burst - 1) * interval
+            return max(0.0, next_time - tolerance - now)
+
+    def acquire(self, interval=None):
+        """
+        Blocks until a request can be sent.
+
+        Args:
+            interval (``float``, optional): Overrides the limiter interval
+                for this request.
+
+        Returns:
+            wait (``float``): Seconds spent waiting
+        """
+        if interval is None:
+            interval = self.interval
+        wait = self._reserve(interval)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds):
+        """
+        Delays the next request by at least ``seconds``.
+        Used to back off after the API responds with a rate limit error.
+
+        Args:
+            seconds (``float``): Seconds to wait before the next request.
+        """
+        with self._lock:
+            tolerance = (self.burst - 1) * self.interval
+            penalty_time = time.monotonic() + seconds + tolerance
+            self._next_time = max(self._next_time, penalty_time)
+
+    def __repr__(self):
+        return "<RateLimiter interval:{} burst:{}>".format(self.interval, self.burst)
+
+
+class AsyncRateLimiter(RateLimiter):
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    async def acquire(self, interval=None):
+        """
+        Waits without blocking the event loop until a request can be sent.
+        See :any:`RateLimiter.acquire`.
+        """
+        if interval is None:
+            interval = self.interval
+        wait = self._reserve(interval)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def __repr__(self):
+        return "<AsyncRateLimiter interval:{} burst:{}>".format(
+            self.interval, self.burst
+        )
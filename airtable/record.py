@@ -0,0 +1,108 @@
+"""
+Scans can return compact :any:`Record` objects instead of dicts, to hold
+large tables in less memory:
+
+>>> records = airtable.get_all(compact=True)
+>>> record = records[0]
+>>> record.id, record['id']
+('recwPQIfs4wKPyc9D', 'recwPQIfs4wKPyc9D')
+>>> record['fields']['Name']
+'John'
+
+Records keep the keys of the records returned by the API (``id``,
+``fields`` and ``createdTime``), so code written for dicts keeps working.
+Field names are interned, so all records share the same name strings.
+
+With ``lazy=True``, the fields of each record are kept as JSON and only
+decoded the first time they are accessed, which helps when only some of
+the records of a scan are used:
+
+>>> records = airtable.get_all(compact=True, lazy=True)
+
+Use :any:`Record.to_dict` to get a plain dict, to serialize a record.
+
+"""  #
+from __future__ import absolute_import
+import json
+import sys
+from collections.abc import Mapping
+
+
+def _interned_dict(pairs):
+    """ object_pairs_hook of json.loads that interns keys """
+    return {sys.intern(key): value for key, value in pairs}
+
+
+class Record(Mapping):
+
+    __slots__ = ("id", "created_time", "_fields")
+
+    def __init__(self, record_id, fields, created_time=None):
+        """
+        Record with the keys of a record dict, ``id``, ``fields`` and
+        ``createdTime``.
+
+        Args:
+            record_id (``str``): Airtable record id
+            fields (``dict``, ``str``): Fields of the record, or their JSON
+                to decode them when they are first accessed.
+            created_time (``str``, optional): Creation time of the record
+        """
+        self.id = record_id
+        self.created_time = created_time
+        self._fields = fields
+
+    @classmethod
+    def from_dict(cls, record, lazy=False):
+        """ Returns a Record from a record dict """
+        fields = record.get("fields", {})
+        if lazy:
+            fields = json.dumps(fields, separators=(",", ":"), ensure_ascii=False)
+        else:
+            fields = {sys.intern(name): value for name, value in fields.items()}
+        return cls(record["id"], fields, record.get("createdTime"))
+
+    @property
+    def fields(self):
+        if isinstance(self._fields, str):
+            self._fields = json.loads(self._fields, object_pairs_hook=_interned_dict)
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = fields
+
+    def to_dict(self):
+        """ Returns the record as a dict """
+        return dict(self.items())
+
+    def __getitem__(self, key):
+        if key == "id":
+            return self.id
+        if key == "fields":
+            return self.fields
+        if key == "createdTime" and self.created_time is not None:
+            return self.created_time
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == "id":
+            self.id = value
+        elif key == "fields":
+            self.fields = value
+        elif key == "createdTime":
+            self.created_time = value
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        yield "id"
+        yield "fields"
+        if self.created_time is not None:
+            yield "createdTime"
+
+    def __len__(self):
+        return 2 if self.created_time is None else 3
+
+    def __repr__(self):
+        return "<Record id:{}>".format(self.id)
@@ -0,0 +1,243 @@
+"""
+A :any:`SQLiteReplica` materializes a table into a local SQLite database,
+so read heavy jobs can query it without calling the API.
+
+>>> replica = SQLiteReplica(
+...     airtable, 'Email', 'orders.db', indexed_fields=['Email']
+... )
+>>> replica.refresh()  # Retrieves all records the first time
+>>> replica.match('Email', 'john@example.com')
+{'id': 'recwPQIfs4wKPyc9D', 'fields': {'Email': 'john@example.com', ...}, ...}
+>>> replica.search('Status', 'Open')
+[{'id': 'recwPQIfs4wKPyc9D', ...}, ...]
+>>> replica.refresh()  # Only retrieves records modified since the last refresh
+
+Records are stored as JSON. Each field in ``indexed_fields`` gets a
+generated column with an index, so :any:`match` and :any:`search` on those
+fields do not scan the replica. Refreshes use a :any:`TableSync`, and its
+high water mark is stored in the database so refreshes continue
+incrementally across processes.
+
+Generated columns require SQLite 3.31 or later, so ``indexed_fields`` can
+only be used with those versions.
+
+"""  #
+from __future__ import absolute_import
+import json
+import sqlite3
+from collections.abc import MutableMapping
+
+from .sync import TableSync
+
+
+def _quote_identifier(name):
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _json_path(field_name):
+    if '"' in field_name:
+        raise ValueError("field name cannot contain '\"': {}".format(field_name))
+    return "'$.\"{}\"'".format(field_name.replace("'", "''"))
+
+
+class _ReplicaRecords(MutableMapping):
+    """ Records of a replica by record id, used as a TableSync snapshot """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __getitem__(self, record_id):
+        row = self.connection.execute(
+            "SELECT id, created_time, fields FROM records WHERE id = ?", (record_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(record_id)
+        return _to_record(row)
+
+    def __setitem__(self, record_id, record):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO records (id, created_time, fields) "
+            "VALUES (?, ?, ?)",
+            (record_id, record.get("createdTime"), json.dumps(record["fields"])),
+        )
+
+    def __delitem__(self, record_id):
+        self.connection.execute("DELETE FROM records WHERE id = ?", (record_id,))
+
+    def __iter__(self):
+        rows = self.connection.execute("SELECT id FROM records").fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+
+def _to_record(row):
+    record_id, created_time, fields = row
+    record = {"id": record_id, "fields": json.loads(fields)}
+    if created_time is not None:
+        record["createdTime"] = created_time
+    return record
+
+
+class SQLiteReplica(object):
+    def __init__(
+        self,
+        airtable,
+        scan_field,
+        path=":memory:",
+        table_name=None,
+        indexed_fields=(),
+        **options
+    ):
+        """
+        Local SQLite replica of a table.
+
+        Args:
+            airtable (``AirtableBase``): Client used to retrieve records.
+            scan_field (``str``): Field retrieved by the scan that detects
+                deleted records, see :any:`TableSync`.
+            path (``str``): Path of the SQLite database.
+                Default is an in-memory database.
+            table_name (``str``, optional): Airtable table name.
+                Default is the table of an :any:`Airtable` client.
+            indexed_fields (``list``): Fields with a generated column and an
+                index. Requires SQLite 3.31 or later.
+
+        Keyword Args:
+            view, formula, fields: Options of the records to replicate,
+                see :any:`TableSync`.
+        """
+        if indexed_fields and sqlite3.sqlite_version_info < (3, 31, 0):
+            raise RuntimeError(
+                "indexed_fields require SQLite 3.31 or later, found {}".format(
+                    sqlite3.sqlite_version
+                )
+            )
+        self.connection = sqlite3.connect(path)
+        self.indexed_fields = list(indexed_fields)
+        self._create_schema()
+        self.sync = TableSync(
+            airtable,
+            scan_field,
+            table_name=table_name,
+            records=_ReplicaRecords(self.connection),
+            high_water_mark=self._get_meta("high_water_mark"),
+            **options
+        )
+
+    def _create_schema(self):
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS records "
+                "(id TEXT PRIMARY KEY, created_time TEXT, fields TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            if not self.indexed_fields:
+                return
+            columns = set(
+                row[1]
+                for row in self.connection.execute("PRAGMA table_xinfo(records)")
+            )
+            for field_name in self.indexed_fields:
+                column = self._column_name(field_name)
+                if column in columns:
+                    continue
+                self.connection.execute(
+                    "ALTER TABLE records ADD COLUMN {} "
+                    "GENERATED ALWAYS AS (json_extract(fields, {})) VIRTUAL".format(
+                        _quote_identifier(column), _json_path(field_name)
+                    )
+                )
+                self.connection.execute(
+                    "CREATE INDEX {} ON records ({})".format(
+                        _quote_identifier("index:" + field_name),
+                        _quote_identifier(column),
+                    )
+                )
+
+    @staticmethod
+    def _column_name(field_name):
+        return "field:" + field_name
+
+    def _get_meta(self, key):
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def refresh(self):
+        """
+        Retrieves records modified since the last refresh, or all records
+        the first time, and applies them to the replica in one transaction.
+
+        Returns:
+            result (``SyncResult``): See :any:`TableSync.sync`
+        """
+        with self.connection:
+            result = self.sync.sync()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                ("high_water_mark", self.sync.high_water_mark),
+            )
+        return result
+
+    def _where(self, field_name):
+        if field_name in self.indexed_fields:
+            return "{} = ?".format(_quote_identifier(self._column_name(field_name)))
+        return "json_extract(fields, {}) = ?".format(_json_path(field_name))
+
+    def _select(self, where="", params=(), limit=None):
+        query = "SELECT id, created_time, fields FROM records"
+        if where:
+            query += " WHERE " + where
+        if limit is not None:
+            query += " LIMIT {:d}".format(limit)
+        return [_to_record(row) for row in self.connection.execute(query, params)]
+
+    def get(self, record_id):
+        """
+        Returns a record by its id, or ``None``.
+
+        Args:
+            record_id(``str``): Airtable record id
+        """
+        return self.sync.records.get(record_id)
+
+    def match(self, field_name, field_value):
+        """
+        Returns first record to match field name and value, or ``{}``.
+
+        Args:
+            field_name (``str``): Name of field to match (column name).
+            field_value (``str``): Value of field to match.
+        """
+        records = self._select(self._where(field_name), (field_value,), limit=1)
+        return records[0] if records else {}
+
+    def search(self, field_name, field_value):
+        """
+        Returns all records that match field name and value.
+
+        Args:
+            field_name (``str``): Name of field to match (column name).
+            field_value (``str``): Value of field to match.
+        """
+        return self._select(self._where(field_name), (field_value,))
+
+    def all(self):
+        """ Returns all records of the replica """
+        return self._select()
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return len(self.sync.records)
+
+    def __repr__(self):
+        return "<SQLiteReplica table:{} records:{}>".format(
+            self.sync.table_name, len(self)
+        )
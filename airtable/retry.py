@@ -0,0 +1,136 @@
+"""
+Requests that fail with a rate limit (429) or server error (5xx) response
+are retried by the :any:`Airtable` class according to its
+:any:`RetryPolicy`.
+
+The ``Retry-After`` header is honored when present, otherwise a jittered
+exponential backoff is used. Each backoff delays the shared
+:any:`RateLimiter`, so other requests to the same base back off as well.
+
+>>> airtable = Airtable(base_key, table_name)
+>>> airtable.retry_policy
+<RetryPolicy max_retries:5 retries:0 backoff_time:0.0>
+
+To retry less, or not at all:
+
+>>> policy = RetryPolicy(max_retries=0)
+>>> airtable = Airtable(base_key, table_name, retry_policy=policy)
+
+The ``retries`` and ``backoff_time`` attributes of the policy count the
+retries made and the total seconds spent backing off.
+
+"""  #
+from __future__ import absolute_import
+import random
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+
+class RetryPolicy(object):
+
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+    def __init__(
+        self,
+        max_retries=5,
+        backoff_factor=0.5,
+        max_backoff=30.0,
+        retry_non_idempotent=False,
+    ):
+        """
+        Retry policy used by Airtable Class
+
+        Rate limit (429) responses are always retried since the request was
+        not processed. Server errors and connection errors are only retried
+        for idempotent methods, unless ``retry_non_idempotent`` is set.
+
+        Args:
+            max_retries (``int``): Maximum number of retries per request.
+                Default is 5.
+            backoff_factor (``float``): Backoff of the first retry in seconds,
+                doubled on each retry. Default is 0.5.
+            max_backoff (``float``): Maximum backoff in seconds.
+                Default is 30.
+            retry_non_idempotent (``bool``): Also retry ``POST`` and
+                ``PATCH`` on server errors. Default is False.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_non_idempotent = retry_non_idempotent
+        self.retries = 0
+        self.backoff_time = 0.0
+        self._lock = threading.Lock()
+
+    def is_idempotent(self, method):
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def should_retry(self, method, attempt, response=None, idempotent=None):
+        """
+        Returns True if a request should be retried.
+
+        Args:
+            method (``str``): Http method of the request
+            attempt (``int``): Number of retries already made
+            response (``requests.Response``): Response received, or None if
+                the request failed with a connection error.
+            idempotent (``bool``, optional): Whether the request is
+                idempotent, for requests that only read with a method that
+                is not, like ``POST`` to ``listRecords``.
+                Default is to check ``method``.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if response is not None:
+            if response.status_code not in self.RETRY_STATUSES:
+                return False
+            if response.status_code == 429:
+                return True
+        if idempotent is None:
+            idempotent = self.is_idempotent(method)
+        return self.retry_non_idempotent or idempotent
+
+    @staticmethod
+    def _retry_after(response):
+        """ Returns ``Retry-After`` header in seconds, or None """
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            date = parsedate_tz(value)
+            if date is None:
+                return None
+            return max(0.0, mktime_tz(date) - time.time())
+
+    def backoff(self, attempt, response=None):
+        """
+        Returns seconds to wait before retrying, and records it in
+        ``retries`` and ``backoff_time``.
+
+        Args:
+            attempt (``int``): Number of retries already made
+            response (``requests.Response``): Response received, or None
+        """
+        delay = self._retry_after(response)
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+            delay = random.uniform(delay / 2, delay)
+        with self._lock:
+            self.retries += 1
+            self.backoff_time += delay
+        return delay
+
+    def reset_stats(self):
+        """ Resets ``retries`` and ``backoff_time`` """
+        with self._lock:
+            self.retries = 0
+            self.backoff_time = 0.0
+
+    def __repr__(self):
+        return "<RetryPolicy max_retries:{} retries:{} backoff_time:{}>".format(
+            self.max_retries, self.retries, self.backoff_time
+        )
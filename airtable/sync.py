@@ -0,0 +1,139 @@
+"""
+A :any:`TableSync` keeps a local snapshot of a table up to date, only
+fetching records that were modified since the previous sync.
+
+>>> sync = TableSync(airtable, 'Name')
+>>> sync.sync()  # Retrieves all records
+SyncResult(added=[...], updated=[], deleted=[])
+>>> sync.sync()  # Retrieves records modified since the last sync
+SyncResult(added=[], updated=[{'id': 'recwPQIfs4wKPyc9D', ...}], deleted=[])
+>>> sync.records['recwPQIfs4wKPyc9D']
+{'id': 'recwPQIfs4wKPyc9D', 'fields': {...}, ...}
+
+Modified records are found with a ``LAST_MODIFIED_TIME()`` formula.
+Deleted records are found by scanning the record ids of the table,
+retrieving only ``scan_field``, which is required; set it to a small field
+of the table to keep the scan cheap.
+
+"""  #
+from __future__ import absolute_import
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+SyncResult = namedtuple("SyncResult", ["added", "updated", "deleted"])
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
+
+
+class TableSync(object):
+    def __init__(
+        self,
+        airtable,
+        scan_field,
+        table_name=None,
+        overlap=60,
+        records=None,
+        high_water_mark=None,
+        **options
+    ):
+        """
+        Incremental sync of a table.
+
+        Args:
+            airtable (``AirtableBase``): Client used to retrieve records.
+            scan_field (``str``): Field retrieved by the scan that detects
+                deleted records, so the scan does not retrieve every field
+                of every record on each sync.
+            table_name (``str``, optional): Airtable table name.
+                Default is the table of an :any:`Airtable` client.
+            overlap (``int``): Seconds subtracted from the high water mark
+                to allow for clock differences and slow writes. Default is 60.
+            records (``dict``, optional): Snapshot of a previous sync,
+                by record id. It is updated in place by :any:`sync`.
+            high_water_mark (``str``, optional): High water mark of a
+                previous sync. If not set, the first sync retrieves all records.
+
+        Keyword Args:
+            view (``str``, optional): The name or ID of a view.
+            formula (``str``, optional): Airtable formula. Only records that
+                match it are synced.
+            fields (``str``, ``list``, optional): Fields to retrieve.
+        """
+        self.airtable = airtable
+        self.table_name = table_name or airtable.table_name
+        self.scan_field = scan_field
+        self.overlap = overlap
+        self.options = options
+        self.records = {} if records is None else records
+        self.high_water_mark = high_water_mark
+
+    def _formula(self, formula=None):
+        """ Combines ``formula`` with the formula of the sync options """
+        base_formula = self.options.get("formula") or self.options.get(
+            "filterByFormula"
+        )
+        formulas = [f for f in (base_formula, formula) if f]
+        if len(formulas) < 2:
+            return formulas[0] if formulas else None
+        return "AND({})".format(", ".join(formulas))
+
+    def _iter_records(self, formula=None, **options):
+        params = dict(self.options, **options)
+        params.pop("filterByFormula", None)
+        params["formula"] = self._formula(formula)
+        if params["formula"] is None:
+            del params["formula"]
+        for records in self.airtable.get_iter_in_table(self.table_name, **params):
+            for record in records:
+                yield record
+
+    def modified_formula(self):
+        """ Returns formula matching records modified after the high water mark """
+        return "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{}'))".format(
+            self.high_water_mark
+        )
+
+    def scan_ids(self):
+        """ Returns the ids of all records, retrieving only ``scan_field`` """
+        records = self._iter_records(fields=[self.scan_field])
+        return set(record["id"] for record in records)
+
+    def sync(self):
+        """
+        Retrieves records modified since the previous sync, and the ids of
+        all records to detect deletions, then applies them to ``records``.
+
+        Returns:
+            result (``SyncResult``): ``added`` and ``updated`` records, and
+                ``deleted`` record ids.
+        """
+        started = datetime.now(timezone.utc) - timedelta(seconds=self.overlap)
+
+        if self.high_water_mark is None:
+            modified = list(self._iter_records())
+            record_ids = set(record["id"] for record in modified)
+        else:
+            modified = list(self._iter_records(formula=self.modified_formula()))
+            record_ids = self.scan_ids()
+            record_ids.update(record["id"] for record in modified)
+
+        result = SyncResult([], [], [])
+        for record in modified:
+            previous = self.records.get(record["id"])
+            if previous is None:
+                result.added.append(record)
+            elif previous != record:
+                result.updated.append(record)
+            self.records[record["id"]] = record
+        for record_id in list(self.records):
+            if record_id not in record_ids:
+                result.deleted.append(record_id)
+                del self.records[record_id]
+
+        self.high_water_mark = started.strftime(TIMESTAMP_FORMAT)
+        return result
+
+    def __repr__(self):
+        return "<TableSync table:{} records:{}>".format(
+            self.table_name, len(self.records)
+        )
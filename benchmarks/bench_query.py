@@ -0,0 +1,60 @@
+"""
+Per page CPU overhead of building the url of a scan page.
+
+Compares processing the params on every page, as scans did before
+queries were compiled, with a query compiled once per scan. The last two
+lines include the preparation of the request by requests.
+
+    $ PYTHONPATH=. python benchmarks/bench_query.py
+"""
+from __future__ import print_function
+import timeit
+
+import requests
+from six.moves.urllib.parse import parse_qs, urlsplit
+
+from airtable import Airtable
+
+OPTIONS = {
+    "view": "Grid view",
+    "fields": ["Name", "Email", "Status", "Created", "Owner", "Notes"],
+    "sort": ["-Created", "Name"],
+    "formula": "AND({Status}='Open', NOT({Email}=''))",
+    "page_size": 100,
+}
+OFFSET = "itrAbCdEfGhIjKlMn/recAbCdEfGhIjKlMn"
+
+
+def main(number=20000):
+    airtable = Airtable("appBenchmark", "Table", api_key="keyBenchmark")
+    url = airtable.url_table
+    encode = requests.models.RequestEncodingMixin._encode_params
+
+    def process_every_page():
+        params = airtable._process_params(dict(OPTIONS, offset=OFFSET))
+        return "{}?{}".format(url, encode(params))
+
+    query = airtable._compile_query(url, OPTIONS)
+
+    def compiled_query():
+        return query.page_url(OFFSET)
+
+    def prepare(func):
+        return lambda: requests.Request("get", func()).prepare()
+
+    expected, compiled = urlsplit(process_every_page()), urlsplit(compiled_query())
+    assert expected.path == compiled.path
+    assert parse_qs(expected.query) == parse_qs(compiled.query)
+
+    for name, func in [
+        ("process params every page", process_every_page),
+        ("compiled query", compiled_query),
+        ("process every page, prepare", prepare(process_every_page)),
+        ("compiled query, prepare", prepare(compiled_query)),
+    ]:
+        seconds = min(timeit.repeat(func, number=number, repeat=3))
+        print("{:<30} {:8.2f} us/page".format(name, seconds / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Memory used by the records of a scan, as dicts and as compact Records.
+
+Decodes pages of synthetic records the way scans do, one JSON document per
+page, and measures the memory held by the records with tracemalloc, for
+ASCII and non-ASCII text.
+
+    $ PYTHONPATH=. python benchmarks/bench_records.py
+"""
+from __future__ import print_function
+import json
+import tracemalloc
+
+from airtable.record import Record
+
+FIELD_NAMES = ["Name", "Email", "Status", "Created", "Owner", "Notes", "Amount"]
+
+
+def make_pages(count, page_size=100, notes="Notes of record {}"):
+    pages = []
+    for start in range(0, count, page_size):
+        records = [
+            {
+                "id": "rec{:014d}".format(n),
+                "createdTime": "2020-01-01T00:00:00.000Z",
+                "fields": {
+                    "Name": "Name {}".format(n),
+                    "Email": "user{}@example.com".format(n),
+                    "Status": "Open" if n % 2 else "Closed",
+                    "Created": "2020-01-01",
+                    "Owner": ["rec{:014d}".format(n % 50)],
+                    "Notes": notes.format(n),
+                    "Amount": n * 1.5,
+                },
+            }
+            for n in range(start, min(start + page_size, count))
+        ]
+        pages.append(json.dumps({"records": records}))
+    return pages
+
+
+def measure(pages, convert):
+    tracemalloc.start()
+    records = []
+    for page in pages:
+        records.extend(convert(json.loads(page)["records"]))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, records
+
+
+def main(count=50000):
+    datasets = [
+        ("ASCII", make_pages(count)),
+        ("non-ASCII", make_pages(count, notes="Café n°{} — déjà vu ☃ 日本語")),
+    ]
+    results = [
+        ("dict", lambda records: records),
+        ("Record", lambda records: [Record.from_dict(r) for r in records]),
+        ("Record, lazy", lambda records: [Record.from_dict(r, True) for r in records]),
+    ]
+    for label, pages in datasets:
+        print("{} records, {}".format(count, label))
+        baseline = None
+        for name, convert in results:
+            size, _ = measure(pages, convert)
+            baseline = baseline or size
+            print(
+                "{:<14} {:8.1f} MB {:6.0%}".format(name, size / 1e6, size / baseline)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,12 @@ with open(os.path.join(here, "HISTORY.md"), mode="r", encoding="utf-8") as f:
 setup_requires = ["pytest-runner"]
 install_requires = ["requests>=2", "six>=1.10"]
 tests_require = ["requests-mock", "requests"]
+extras_require = {
+    "async": ["aiohttp>=3"],
+    "arrow": ["pyarrow"],
+    "numpy": ["numpy"],
+    "orjson": ["orjson"],
+}
 
 setup(
     name=about["__name__"],
@@ -32,6 +38,7 @@ setup(
     setup_requires=setup_requires,
     install_requires=install_requires,
     tests_require=tests_require,
+    extras_require=extras_require,
     keywords=["airtable", "api"],
     license=about["__license__"],
     classifiers=[
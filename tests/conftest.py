@@ -4,6 +4,7 @@ from posixpath import join as urljoin
 from six.moves.urllib.parse import urlencode, quote
 
 from airtable import Airtable
+from airtable.rate_limit import AsyncRateLimiter, RateLimiter
 
 
 @pytest.fixture
@@ -21,6 +22,40 @@ def url_builder():
     return _url_builder
 
 
+@pytest.fixture(autouse=True)
+def shared_limiters(monkeypatch):
+    """ Gives each test its own shared rate limiters """
+    monkeypatch.setattr(RateLimiter, "_shared", {})
+    monkeypatch.setattr(AsyncRateLimiter, "_shared", {})
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    """ Replaces time in rate_limit, retry and cache modules with a fake clock """
+
+    class FakeTime:
+        now = 100.0
+        sleeps = []
+
+        @classmethod
+        def monotonic(cls):
+            return cls.now
+
+        @classmethod
+        def time(cls):
+            return cls.now
+
+        @classmethod
+        def sleep(cls, seconds):
+            cls.sleeps.append(seconds)
+            cls.now += seconds
+
+    monkeypatch.setattr("airtable.rate_limit.time", FakeTime)
+    monkeypatch.setattr("airtable.retry.time", FakeTime)
+    monkeypatch.setattr("airtable.cache.time", FakeTime)
+    return FakeTime
+
+
 @pytest.fixture
 def constants():
     return dict(
@@ -28,11 +63,29 @@ def constants():
     )
 
 
+@pytest.fixture
+def make_table(constants):
+    """
+    Builds clients of the test table without rate limit.
+    Keyword arguments are passed to :any:`Airtable`.
+    """
+
+    def _make_table(**kwargs):
+        kwargs.setdefault("rate_limiter", RateLimiter(interval=0))
+        return Airtable(
+            constants["BASE_KEY"],
+            constants["TABLE_NAME"],
+            api_key=constants["API_KEY"],
+            **kwargs
+        )
+
+    return _make_table
+
+
 @pytest.fixture()
-def table(constants):
-    return Airtable(
-        constants["API_KEY"], constants["TABLE_NAME"], api_key=constants["BASE_KEY"]
-    )
+def table(request, make_table):
+    """ Client of the test table, with keyword arguments from indirect params """
+    return make_table(**getattr(request, "param", {}))
 
 
 @pytest.fixture
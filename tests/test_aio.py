@@ -0,0 +1,153 @@
+import asyncio
+import json
+
+import pytest
+import requests
+
+from airtable.aio import AsyncAirtable
+from airtable.rate_limit import AsyncRateLimiter
+from airtable.retry import RetryPolicy
+
+
+class FakeResponse:
+    def __init__(self, status=200, json_data=None, headers=None, url=""):
+        self.status = status
+        self.reason = "Reason"
+        self.headers = headers or {}
+        self.url = url
+        self._content = json.dumps(json_data or {}).encode("utf-8")
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeSession:
+    """ Records requests and replies with the queued responses """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        body = None if data is None else json.loads(data)
+        self.requests.append(dict(method=method, url=url, params=params, json=body))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def async_table(constants):
+    def _async_table(responses):
+        return AsyncAirtable(
+            constants["BASE_KEY"],
+            constants["TABLE_NAME"],
+            api_key=constants["API_KEY"],
+            session=FakeSession(responses),
+            rate_limiter=AsyncRateLimiter(interval=0),
+            retry_policy=RetryPolicy(backoff_factor=0),
+        )
+
+    return _async_table
+
+
+def test_get_all(async_table, mock_response_list, mock_records):
+    table = async_table([FakeResponse(json_data=r) for r in mock_response_list])
+    records = asyncio.run(table.get_all(view="View", fields=["A", "B"]))
+
+    assert records == mock_records
+    first, second = table.session.requests
+    assert first["params"] == [("fields[]", "A"), ("fields[]", "B"), ("view", "View")]
+    assert ("offset", mock_response_list[0]["offset"]) in second["params"]
+
+
+def test_get_iter(async_table, mock_response_list):
+    table = async_table([FakeResponse(json_data=r) for r in mock_response_list])
+
+    async def _pages():
+        return [page async for page in table.get_iter()]
+
+    pages = asyncio.run(_pages())
+    assert pages == [r["records"] for r in mock_response_list]
+
+
+def test_batch_insert(async_table):
+    records = [{"Value": str(n)} for n in range(12)]
+    responses = [
+        FakeResponse(json_data={"records": [{"id": "rec", "fields": f}]})
+        for f in [records[:10], records[10:]]
+    ]
+    table = async_table(responses)
+    resp = asyncio.run(table.batch_insert(records, typecast=True))
+
+    sent = table.session.requests
+    assert [len(r["json"]["records"]) for r in sent] == [10, 2]
+    assert all(r["json"]["typecast"] for r in sent)
+    assert len(resp) == 2
+
+
+def test_batch_delete(async_table):
+    record_ids = ["rec{}".format(n) for n in range(11)]
+    responses = [
+        FakeResponse(json_data={"records": [{"id": _id, "deleted": True}]})
+        for _id in record_ids[:2]
+    ]
+    table = async_table(responses)
+    asyncio.run(table.batch_delete(record_ids))
+
+    sent = table.session.requests
+    assert [r["method"] for r in sent] == ["delete", "delete"]
+    assert [len(r["params"]) for r in sent] == [10, 1]
+
+
+@pytest.mark.parametrize("max_workers, expected", [(None, 5), (2, 2)])
+def test_batch_request_max_workers(async_table, max_workers, expected):
+    table = async_table([])
+    if max_workers is not None:
+        table.max_workers = max_workers
+    running = []
+    peak = []
+
+    async def func(item):
+        running.append(item)
+        peak.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(item)
+        return item
+
+    results = asyncio.run(table._batch_request(func, range(12)))
+    assert results == list(range(12))
+    assert max(peak) == expected
+
+
+def test_retry_and_error(async_table, mock_response_single):
+    table = async_table(
+        [
+            FakeResponse(status=429),
+            FakeResponse(json_data=mock_response_single),
+            FakeResponse(status=404, json_data={"error": "NOT_FOUND"}),
+        ]
+    )
+    assert asyncio.run(table.get("rec1")) == mock_response_single
+    assert table.retry_policy.retries == 1
+
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        asyncio.run(table.get("rec1"))
+    assert "NOT_FOUND" in str(exc_info.value)
+
+
+def test_get_all_list_records_post(async_table, mock_response_list, mock_records):
+    table = async_table([FakeResponse(json_data=r) for r in mock_response_list])
+    table.MAX_URL_LENGTH = 0
+    records = asyncio.run(table.get_all(view="View"))
+
+    assert records == mock_records
+    first, second = table.session.requests
+    assert first["method"] == "post"
+    assert first["url"].endswith("/listRecords")
+    assert first["json"] == {"view": "View"}
+    assert second["json"] == {"view": "View", "offset": mock_response_list[0]["offset"]}
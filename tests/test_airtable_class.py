@@ -1,8 +1,11 @@
 import pytest
+import requests
 from posixpath import join as urljoin
 from requests_mock import Mocker
 
-from airtable import Airtable
+from airtable import Airtable, BatchRequestError
+from airtable.airtable import _prefetch
+from airtable.cache import RecordCache
 
 
 def test_repr(table):
@@ -62,6 +65,34 @@ def test_get_all(table, mock_response_list, mock_records):
         assert dict_equals(resp, mock_records[n])
 
 
+def test_get_iter_prefetch(table, mock_response_list, mock_response_iterator):
+    with Mocker() as mock:
+        mock.get(table.url_table, json=mock_response_iterator)
+        pages = list(table.get_iter(prefetch=2))
+    assert pages == [r["records"] for r in mock_response_list]
+
+
+def test_get_iter_prefetch_error(table, mock_response_list):
+    with Mocker() as mock:
+        mock.get(table.url_table, [{"json": mock_response_list[0]}, {"status_code": 404}])
+        pages = table.get_iter(prefetch=1)
+        assert next(pages) == mock_response_list[0]["records"]
+        with pytest.raises(requests.exceptions.HTTPError):
+            next(pages)
+
+
+@pytest.mark.parametrize("error", [KeyboardInterrupt, SystemExit])
+def test_prefetch_base_exception(error):
+    def pages():
+        yield 1
+        raise error()
+
+    prefetched = _prefetch(pages(), 1)
+    assert next(prefetched) == 1
+    with pytest.raises(error):
+        next(prefetched)
+
+
 def test_insert(table, mock_response_single):
     with Mocker() as mock:
         post_data = mock_response_single["fields"]
@@ -75,19 +106,93 @@ def test_insert(table, mock_response_single):
     assert dict_equals(resp, mock_response_single)
 
 
-@pytest.mark.skip("Todo")
-def test_match(table, mock_response_single):
-    pass
+def test_iter_records(table, mock_response_iterator, mock_records):
+    with Mocker() as mock:
+        mock.get(table.url_table, json=mock_response_iterator)
+        records = list(table.iter_records())
+        assert mock.call_count == 2
+    assert records == mock_records
 
 
-@pytest.mark.skip("Todo")
-def test_search(table, mock_response_single):
-    pass
+def test_iter_records_limit(table, mock_response_iterator, mock_records):
+    with Mocker() as mock:
+        mock.get(table.url_table, json=mock_response_iterator)
+        records = list(table.iter_records(limit=2))
+        assert mock.call_count == 1
+        assert mock.last_request.qs["pagesize"] == ["2"]
+    assert records == mock_records[:2]
 
 
-@pytest.mark.skip("Todo")
-def test_batch_insert(table, mock_response_single):
-    pass
+def test_iter_records_break(table, mock_response_iterator, mock_records):
+    with Mocker() as mock:
+        mock.get(table.url_table, json=mock_response_iterator)
+        for record in table.iter_records():
+            break
+        assert mock.call_count == 1
+    assert record == mock_records[0]
+
+
+def test_match(table, mock_response_iterator, mock_records):
+    with Mocker() as mock:
+        mock.get(table.url_table, json=mock_response_iterator)
+        record = table.match("Value", "abc")
+        assert mock.call_count == 1
+        qs = mock.last_request.qs
+    assert qs["filterbyformula"] == ["{value}='abc'"]
+    assert qs["maxrecords"] == ["1"]
+    assert qs["pagesize"] == ["1"]
+    assert record == mock_records[0]
+
+
+def test_search(table, mock_response_iterator, mock_records):
+    with Mocker() as mock:
+        mock.get(table.url_table, json=mock_response_iterator)
+        records = table.search("SameField", 1234)
+        assert mock.last_request.qs["filterbyformula"] == ["{samefield}=1234"]
+    assert records == mock_records
+
+
+def test_batch_insert(table):
+    records = [{"Value": str(n)} for n in range(12)]
+
+    def _create_records(request, context):
+        assert request.json()["typecast"] is True
+        return {
+            "records": [
+                {"id": "rec{}".format(r["fields"]["Value"]), "fields": r["fields"]}
+                for r in request.json()["records"]
+            ]
+        }
+
+    with Mocker() as mock:
+        mock.post(table.url_table, status_code=200, json=_create_records)
+        resp = table.batch_insert(records, typecast=True)
+        chunk_sizes = [len(r.json()["records"]) for r in mock.request_history]
+
+    assert chunk_sizes == [10, 2]
+    assert [r["id"] for r in resp] == ["rec{}".format(n) for n in range(12)]
+    assert [r["fields"] for r in resp] == records
+
+
+@pytest.mark.parametrize(
+    "method_name,http_method", [("batch_update", "PATCH"), ("batch_replace", "PUT")]
+)
+def test_batch_update_and_replace(table, method_name, http_method):
+    records = [
+        {"id": "rec{}".format(n), "fields": {"Value": str(n)}} for n in range(11)
+    ]
+
+    def _write_records(request, context):
+        return {"records": request.json()["records"]}
+
+    with Mocker() as mock:
+        mock.register_uri(http_method, table.url_table, json=_write_records)
+        resp = getattr(table, method_name)(records)
+        history = mock.request_history
+
+    assert [len(r.json()["records"]) for r in history] == [10, 1]
+    assert all(r.json()["typecast"] is False for r in history)
+    assert resp == records
 
 
 @pytest.mark.skip("Todo")
@@ -100,19 +205,331 @@ def test_replace(table, mock_response_single):
     pass
 
 
-@pytest.mark.skip("Todo")
 def test_replace_by_field(table, mock_response_single):
-    pass
+    _id = mock_response_single["id"]
+    fields = {"Value": "new"}
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": [{"id": _id, "fields": {}}]})
+        mock.put(
+            table.record_url(_id),
+            json=mock_response_single,
+            additional_matcher=match_request_data(fields),
+        )
+        resp = table.replace_by_field("Value", "abc", fields)
+        get_request = mock.request_history[0]
+    assert get_request.qs["fields[]"] == ["value"]
+    assert resp == mock_response_single
 
 
-@pytest.mark.skip("Todo")
-def test_delete_by_field(table, mock_response_single):
-    pass
+def test_delete_by_field(table):
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": []})
+        resp = table.delete_by_field("Value", "abc")
+        assert mock.call_count == 1
+    assert resp == {}
 
 
-@pytest.mark.skip("Todo")
-def test_batch_delete(table, mock_response_single):
-    pass
+def test_batch_delete(table):
+    record_ids = ["rec{}".format(n) for n in range(15)]
+
+    def _delete_records(request, context):
+        ids = request.qs["records[]"]
+        return {"records": [{"id": _id, "deleted": True} for _id in ids]}
+
+    with Mocker() as mock:
+        mock.delete(table.url_table, json=_delete_records)
+        resp = table.batch_delete(record_ids)
+        history = mock.request_history
+
+    assert [len(r.qs["records[]"]) for r in history] == [10, 5]
+    assert [r["id"] for r in resp] == [_id.lower() for _id in record_ids]
+    assert all(r["deleted"] for r in resp)
+
+
+def test_batch_request_stops_at_first_error(table):
+    record_ids = ["rec{}".format(n) for n in range(30)]
+
+    def _delete_records(request, context):
+        context.status_code = 401
+        return {"error": "AUTHENTICATION_REQUIRED"}
+
+    with Mocker() as mock:
+        mock.delete(table.url_table, json=_delete_records)
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            table.batch_delete(record_ids)
+        assert mock.call_count == 1
+    assert not isinstance(exc_info.value, BatchRequestError)
+
+
+@pytest.mark.parametrize("table", [{"max_workers": 4}], indirect=True)
+def test_batch_request_raises_other_errors(table):
+
+    def func(item):
+        if item == 2:
+            raise KeyError(item)
+        return item
+
+    with pytest.raises(KeyError):
+        table._batch_request(func, range(4))
+
+
+@pytest.mark.parametrize("table", [{"max_workers": 4}], indirect=True)
+def test_batch_request_collects_errors(table):
+    record_ids = ["rec{}".format(n) for n in range(30)]
+
+    def _delete_records(request, context):
+        ids = request.qs["records[]"]
+        if "rec10" in ids:
+            context.status_code = 422
+            return {"error": "INVALID_RECORDS"}
+        return {"records": [{"id": _id, "deleted": True} for _id in ids]}
+
+    with Mocker() as mock:
+        mock.delete(table.url_table, json=_delete_records)
+        with pytest.raises(BatchRequestError) as exc_info:
+            table.batch_delete(record_ids)
+        assert mock.call_count == 3
+
+    error = exc_info.value
+    assert [index for index, _ in error.errors] == [1]
+    assert "INVALID_RECORDS" in str(error)
+    assert [len(r) if r else None for r in error.results] == [10, None, 10]
+
+
+def test_mirror(table, mock_records):
+    records = [{"Value": "new"}]
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": mock_records})
+        mock.delete(
+            table.url_table,
+            json={"records": [{"id": r["id"], "deleted": True} for r in mock_records]},
+        )
+        mock.post(table.url_table, json={"records": [{"id": "rec1", "fields": records[0]}]})
+        new_records, deleted_records = table.mirror(records)
+        methods = [r.method for r in mock.request_history]
+
+    assert methods == ["GET", "DELETE", "POST"]
+    assert new_records == [{"id": "rec1", "fields": records[0]}]
+    assert len(deleted_records) == len(mock_records)
+
+
+def test_mirror_key_field(table):
+    existing = [
+        {"id": "rec1", "fields": {"Name": "John", "Age": 30, "Tags": ["a", "b"]}},
+        {"id": "rec2", "fields": {"Name": "Marc", "Age": 40}},
+        {"id": "rec3", "fields": {"Name": "Gone"}},
+        {"id": "rec4", "fields": {"Name": "John", "Age": 30}},
+    ]
+    records = [
+        {"Name": "John", "Age": 30, "Tags": ["a", "b"]},
+        {"Name": "Marc", "Age": 41, "Tags": []},
+        {"Name": "Anna", "Age": 20},
+    ]
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": existing})
+        plan = table.mirror(records, key_field="Name", dry_run=True)
+        assert len(mock.request_history) == 1
+        assert mock.request_history[0].qs["fields[]"] == ["age", "name", "tags"]
+
+    assert plan.inserts == [{"Name": "Anna", "Age": 20}]
+    assert plan.updates == [{"id": "rec2", "fields": {"Age": 41}}]
+    assert sorted(plan.deletes) == ["rec3", "rec4"]
+    assert plan.unchanged == ["rec1"]
+    assert plan.request_count == 3
+
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": existing})
+        mock.delete(table.url_table, json={"records": [{"id": "rec3"}]})
+        mock.post(table.url_table, json={"records": [{"id": "rec5"}]})
+        mock.patch(table.url_table, json={"records": [{"id": "rec2"}]})
+        result = table.mirror(records, key_field=["Name"])
+        methods = [r.method for r in mock.request_history]
+        patch_json = mock.request_history[-1].json()
+
+    assert methods == ["GET", "DELETE", "POST", "PATCH"]
+    assert patch_json["records"] == [{"id": "rec2", "fields": {"Age": 41}}]
+    assert result.inserted == [{"id": "rec5"}]
+    assert result.updated == [{"id": "rec2"}]
+
+
+def test_mirror_key_field_empty_keys(table):
+    existing = [
+        {"id": "rec1", "fields": {"Name": "John"}},
+        {"id": "rec2", "fields": {"Other": "x"}},
+    ]
+    records = [{"Name": "John"}, {"Other": "y"}]
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": existing})
+        plan = table.mirror(records, key_field="Name", dry_run=True)
+
+    assert plan.inserts == [{"Other": "y"}]
+    assert plan.deletes == ["rec2"]
+    assert plan.unchanged == ["rec1"]
+
+
+def test_mirror_key_field_no_changes(table):
+    existing = [{"id": "rec1", "fields": {"Name": "John"}}]
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": existing})
+        result = table.mirror([{"Name": "John", "Done": False}], key_field="Name")
+        assert len(mock.request_history) == 1
+    assert result == ([], [], [])
+
+
+def test_batch_upsert(table):
+    existing = [
+        {"id": "rec1", "fields": {"First": "John", "Last": "Doe"}},
+        {"id": "rec2", "fields": {"First": "John", "Last": "Roe"}},
+    ]
+    records = [
+        {"First": "John", "Last": "Roe", "Age": 30},
+        {"First": "Anna", "Last": "Doe", "Age": 20},
+    ]
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": existing})
+        mock.post(table.url_table, json={"records": [{"id": "rec3"}]})
+        mock.patch(table.url_table, json={"records": [{"id": "rec2"}]})
+        result = table.batch_upsert(records, ["First", "Last"])
+        get, post, patch = mock.request_history
+
+    assert get.qs["fields[]"] == ["first", "last"]
+    assert post.json()["records"] == [{"fields": records[1]}]
+    assert patch.json()["records"] == [{"id": "rec2", "fields": records[0]}]
+    assert result.created == [{"id": "rec3"}]
+    assert result.updated == [{"id": "rec2"}]
+
+
+def test_batch_upsert_duplicate_keys(table):
+    with pytest.raises(ValueError):
+        table.batch_upsert([{"Name": "A"}, {"Name": "A"}], "Name")
+
+    existing = [{"id": "rec1", "fields": {"Name": "A"}}] * 2
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": existing})
+        with pytest.raises(ValueError):
+            table.batch_upsert([{"Name": "A"}], "Name")
+        assert len(mock.request_history) == 1
+
+
+def test_search_many(table):
+    table.MAX_FORMULA_LENGTH = 30
+    values = ["A", "B", "C", "D"]
+    pages = [
+        {"records": [{"id": "rec1", "fields": {"Name": "A"}}]},
+        {"records": [{"id": "rec2", "fields": {"Name": ["C", "D"]}}]},
+    ]
+    with Mocker() as mock:
+        mock.get(table.url_table, [{"json": page} for page in pages])
+        results = table.search_many("Name", values, fields="Age")
+        first, second = mock.request_history
+
+    assert first.qs["filterbyformula"] == ["or({name}='a',{name}='b')"]
+    assert second.qs["filterbyformula"] == ["or({name}='c',{name}='d')"]
+    assert first.qs["fields[]"] == ["age", "name"]
+    assert list(results) == values
+    assert results["A"] == pages[0]["records"]
+    assert results["B"] == []
+    assert results["C"] == results["D"] == pages[1]["records"]
+
+
+def test_search_many_dict_values(table):
+    owner = {"id": "usr1", "email": "john@example.com", "name": "John"}
+    attachment = {"id": "att1", "url": "https://example.com/a.png"}
+    records = [
+        {"id": "rec1", "fields": {"Owner": owner}},
+        {"id": "rec2", "fields": {"Owner": [attachment, owner]}},
+        {"id": "rec3", "fields": {"Owner": attachment}},
+    ]
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": records})
+        results = table.search_many("Owner", ["John", "Marc"])
+
+    assert results["John"] == records[:2]
+    assert results["Marc"] == []
+
+
+def test_match_many(table):
+    records = [{"id": "rec1", "fields": {"Number": 1}}]
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": records})
+        results = table.match_many("Number", [1, "2"])
+        assert mock.call_count == 1
+    assert results == {1: records[0], "2": {}}
+
+
+def test_get_many(table):
+    table.MAX_FORMULA_LENGTH = 45
+    table.record_cache = RecordCache()
+    table.record_cache.set(table.table_name, {"id": "rec0", "fields": {}})
+    pages = [
+        {"records": [{"id": "rec2", "fields": {}}, {"id": "rec1", "fields": {}}]},
+        {"records": []},
+    ]
+    with Mocker() as mock:
+        mock.get(table.url_table, [{"json": page} for page in pages])
+        result = table.get_many(["rec1", "rec0", "rec2", "rec3"])
+        formulas = [r.qs["filterbyformula"][0] for r in mock.request_history]
+
+    assert formulas == [
+        "or(record_id()='rec1',record_id()='rec2')",
+        "or(record_id()='rec3')",
+    ]
+    assert [r["id"] for r in result.records] == ["rec1", "rec0", "rec2"]
+    assert result.missing == ["rec3"]
+    assert table.record_cache.get(table.table_name, "rec2") is not None
+
+
+def test_get_all_expand(table):
+    orders = [
+        {"records": [{"id": "ord1", "fields": {"Customer": ["cus1"]}}], "offset": "x"},
+        {"records": [{"id": "ord2", "fields": {"Customer": ["cus1", "cus2"]}}]},
+    ]
+    customers = [
+        {"records": [{"id": "cus1", "fields": {"Name": "A", "Account": ["acc1"]}}]},
+        {"records": []},
+    ]
+    accounts = {"records": [{"id": "acc1", "fields": {"Plan": "Pro"}}]}
+    expand = {
+        "Customer": {
+            "table": "Customers",
+            "fields": "Name",
+            "expand": {"Account": "Accounts"},
+        }
+    }
+    with Mocker() as mock:
+        mock.get(table.url_table, [{"json": page} for page in orders])
+        mock.get(table.table_url("Customers"), [{"json": p} for p in customers])
+        mock.get(table.table_url("Accounts"), json=accounts)
+        records = table.get_all(expand=expand)
+        customer_requests = [
+            r for r in mock.request_history if "customers" in r.url.lower()
+        ]
+
+    assert len(customer_requests) == 2
+    assert customer_requests[0].qs["fields[]"] == ["name", "account"]
+    assert customer_requests[1].qs["filterbyformula"] == ["or(record_id()='cus2')"]
+    first, second = records
+    customer = first["fields"]["Customer"][0]
+    assert customer["fields"]["Account"] == accounts["records"]
+    assert second["fields"]["Customer"] == [customer, "cus2"]
+
+
+def test_get_iter_list_records_post(table, mock_response_list):
+    table.MAX_URL_LENGTH = 200
+    formula = "OR({})".format(",".join("{{Name}}='{}'".format(n) for n in range(20)))
+    url = urljoin(table.url_table, "listRecords")
+    with Mocker() as mock:
+        mock.post(url, [{"json": page} for page in mock_response_list])
+        pages = list(table.get_iter(formula=formula, fields="Name", sort="-Name"))
+        first, second = [r.json() for r in mock.request_history]
+
+    assert pages == [page["records"] for page in mock_response_list]
+    assert first == {
+        "fields": ["Name"],
+        "filterByFormula": formula,
+        "sort": [{"field": "Name", "direction": "desc"}],
+    }
+    assert second == dict(first, offset=mock_response_list[0]["offset"])
 
 
 # Helpers
@@ -0,0 +1,158 @@
+import threading
+
+import pytest
+from requests_mock import Mocker
+
+from airtable.cache import QueryCache, RecordCache
+
+
+def make_record(n, value="abc"):
+    return {"id": "rec{}".format(n), "fields": {"Value": value}}
+
+
+def test_get_returns_copy():
+    cache = RecordCache()
+    cache.set("Table", make_record(1))
+    record = cache.get("Table", "rec1")
+    record["fields"]["Value"] = "changed"
+    assert cache.get("Table", "rec1") == make_record(1)
+    assert cache.get("Other Table", "rec1") is None
+    assert cache.stats["hits"] == 2
+    assert cache.stats["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = RecordCache(max_size=2)
+    cache.set("Table", make_record(1))
+    cache.set("Table", make_record(2))
+    cache.get("Table", "rec1")
+    cache.set("Table", make_record(3))
+    assert cache.get("Table", "rec2") is None
+    assert cache.get("Table", "rec1") is not None
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_max_bytes():
+    record_size = len('{"id": "rec1", "fields": {"Value": "abc"}}')
+    cache = RecordCache(max_bytes=record_size * 2)
+    for n in range(1, 4):
+        cache.set("Table", make_record(n))
+    assert len(cache) == 2
+    assert cache.size_bytes == record_size * 2
+    cache.set("Table", make_record(4, value="x" * 100))
+    assert cache.get("Table", "rec4") is None
+
+
+def test_ttl(fake_time):
+    cache = RecordCache(ttl=10)
+    cache.set("Table", make_record(1))
+    fake_time.now += 5
+    assert cache.get("Table", "rec1") is not None
+    fake_time.now += 5
+    assert cache.get("Table", "rec1") is None
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def cached_table(make_table):
+    return make_table(record_cache=RecordCache())
+
+
+def test_get_uses_cache(cached_table, mock_response_single):
+    _id = mock_response_single["id"]
+    with Mocker() as mock:
+        mock.get(cached_table.record_url(_id), json=mock_response_single)
+        assert cached_table.get(_id) == mock_response_single
+        assert cached_table.get(_id) == mock_response_single
+        assert mock.call_count == 1
+    assert cached_table.record_cache.stats["hits"] == 1
+
+
+def test_writes_refresh_cache(cached_table, mock_response_single):
+    _id = mock_response_single["id"]
+    updated = dict(mock_response_single, fields={"Value": "new"})
+    with Mocker() as mock:
+        mock.get(cached_table.record_url(_id), json=mock_response_single)
+        mock.patch(cached_table.record_url(_id), json=updated)
+        mock.delete(cached_table.record_url(_id), json={"id": _id, "deleted": True})
+        cached_table.get(_id)
+        cached_table.update(_id, {"Value": "new"})
+        assert cached_table.get(_id) == updated
+        assert mock.call_count == 2
+        cached_table.delete(_id)
+        cached_table.get(_id)
+        assert mock.call_count == 4
+
+
+@pytest.fixture
+def query_cached_table(make_table):
+    def _query_cached_table(**kwargs):
+        return make_table(query_cache=QueryCache(**kwargs))
+
+    return _query_cached_table
+
+
+def test_query_cache_key_normalized(query_cached_table, mock_records):
+    table = query_cached_table()
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": mock_records})
+        assert table.get_all(view="V", max_records=3) == mock_records
+        assert table.get_all(maxRecords=3, view="V", prefetch=1) == mock_records
+        assert mock.call_count == 1
+        table.get_all(view="Other")
+        assert mock.call_count == 2
+    assert table.query_cache.stats["hits"] == 1
+
+
+@pytest.mark.parametrize(
+    "option",
+    [{"expand": {}}, {"compact": False}, {"lazy": False}, {"prefetch": 0}],
+)
+def test_query_cache_falsy_options(query_cached_table, mock_records, option):
+    table = query_cached_table()
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": mock_records})
+        assert table.get_all(view="V", **option) == mock_records
+        assert table.get_all(view="V") == mock_records
+        assert mock.call_count == 1
+
+
+def test_query_cache_invalidated_by_write(query_cached_table, mock_records):
+    table = query_cached_table()
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": mock_records})
+        mock.post(table.url_table, json=mock_records[0])
+        table.search("Value", "abc")
+        table.search("Value", "abc")
+        assert mock.call_count == 1
+        table.insert({"Value": "abc"})
+        table.search("Value", "abc")
+        assert mock.call_count == 3
+
+
+def test_query_cache_stale_while_revalidate(fake_time, monkeypatch, mock_records):
+    cache = QueryCache(ttl=10, stale_ttl=60)
+    results = [mock_records[:1], mock_records]
+    stored = threading.Event()
+    refresh = cache._refresh
+
+    def _refresh(*args):
+        refresh(*args)
+        stored.set()
+
+    def loader():
+        return results.pop(0)
+
+    monkeypatch.setattr(cache, "_refresh", _refresh)
+    key = cache.make_key("Table", {"view": "V"})
+    assert cache.get(key, loader) == mock_records[:1]
+    fake_time.now += 20
+    # Stale result is returned while it is refreshed
+    assert cache.get(key, loader) == mock_records[:1]
+    assert stored.wait(5)
+    assert cache.get(key, loader) == mock_records
+    fake_time.now += 100
+    with pytest.raises(IndexError):
+        cache.get(key, loader)
+    assert cache.stats["stale_hits"] >= 1
@@ -0,0 +1,102 @@
+import datetime
+import json
+
+import pytest
+from requests_mock import Mocker
+
+from airtable.codec import JSONCodec, _has_long_number, get_codec
+
+CODEC_NAMES = ["json", "orjson", "ujson"]
+
+VALUES = [
+    {"records": [{"id": "rec1", "fields": {"Notes": "café ☃ \"q\" \\ /"}}]},
+    {"float": 0.1, "exp": 1e-300, "negative": -0.0, "list": []},
+    {"nested": {"a": [1, 2.5, None, True, False, {"b": "\n\t"}]}},
+]
+
+
+@pytest.fixture(params=CODEC_NAMES)
+def codec(request):
+    try:
+        return get_codec(request.param)
+    except ImportError:
+        pytest.skip("{} is not installed".format(request.param))
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_codec_matches_json(codec, value):
+    data = json.dumps(value)
+    assert codec.loads(data.encode("utf-8")) == json.loads(data)
+    assert json.loads(codec.dumps(value)) == value
+
+
+@pytest.mark.parametrize(
+    "number", [2 ** 70, -(2 ** 63) - 1, 123456789012345678901234567890]
+)
+def test_codec_big_int(codec, number):
+    value = codec.loads('{{"big":{}}}'.format(number).encode("utf-8"))["big"]
+    assert type(value) is int
+    assert value == number
+    assert codec.dumps({"big": number}) == JSONCodec().dumps({"big": number})
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        (datetime.date(2020, 1, 2), TypeError),
+        (datetime.datetime(2020, 1, 2, 3, 4), TypeError),
+        (float("nan"), ValueError),
+        (float("inf"), ValueError),
+    ],
+)
+def test_codec_dumps_errors(codec, value, error):
+    with pytest.raises(error):
+        codec.dumps({"records": [{"fields": {"Value": value}}]})
+
+
+def test_codec_lone_surrogate(codec):
+    data = codec.dumps({"Notes": "a\ud800", "Name": "café"})
+    assert data == b'{"Notes":"a\\ud800","Name":"caf\\u00e9"}'
+    assert codec.loads(data) == {"Notes": "a\ud800", "Name": "café"}
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b'{"a":12345678901234567890}', True),
+        (b'{"a": [1, -12345678901234567890]}', True),
+        (b'{"a":"12345678901234567890"}', False),
+        (b'{"a":"+33 1234567890123456789"}', False),
+        (b'{"a":123456789012345678}', False),
+    ],
+)
+def test_has_long_number(data, expected):
+    assert _has_long_number(data) is expected
+    assert _has_long_number(data.decode("utf-8")) is expected
+
+
+def test_codec_fallback(codec):
+    assert json.loads(codec.dumps({1: "int key"})) == {"1": "int key"}
+    with pytest.raises(ValueError):
+        codec.loads(b"{invalid")
+
+
+def test_get_codec():
+    assert isinstance(get_codec(), JSONCodec)
+    assert get_codec("json").name == "json"
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_table_codec(make_table, mock_response_single):
+    codec = get_codec("json")
+    table = make_table(codec=codec)
+    assert table.codec is codec
+    with Mocker() as mock:
+        mock.post(table.url_table, json=mock_response_single)
+        resp = table.insert({"Value": "café"})
+        request = mock.request_history[0]
+
+    assert resp == mock_response_single
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.body == b'{"fields":{"Value":"caf\xc3\xa9"},"typecast":false}'
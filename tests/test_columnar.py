@@ -0,0 +1,119 @@
+import pytest
+from requests_mock import Mocker
+
+from airtable.columnar import infer_schema, iter_batches, to_columns, write_parquet
+
+
+@pytest.fixture
+def records():
+    return [
+        {"id": "rec1", "fields": {"Name": "A", "Amount": 1, "Tags": ["x"]}},
+        {"id": "rec2", "fields": {"Done": True, "Amount": 2.5}},
+    ]
+
+
+@pytest.fixture
+def mock_pages(table, records):
+
+    def _mock_pages(mock):
+        pages = [{"records": records[:1], "offset": "itr1"}, {"records": records[1:]}]
+        mock.get(table.url_table, [{"json": page} for page in pages])
+
+    return _mock_pages
+
+
+def test_infer_schema(records):
+    schema = infer_schema(records)
+    assert list(schema.items()) == [
+        ("Name", "str"),
+        ("Amount", "float"),
+        ("Tags", "json"),
+        ("Done", "bool"),
+    ]
+    assert infer_schema(records, columns=["Other"]) == {"Other": "str"}
+
+
+def test_to_columns(records):
+    schema = {"Name": "str", "Amount": "int", "Tags": "json", "Done": "bool"}
+    columns = to_columns(records, schema)
+    assert list(columns) == ["id", "Name", "Amount", "Tags", "Done"]
+    assert columns["id"] == ["rec1", "rec2"]
+    assert columns["Name"] == ["A", None]
+    assert columns["Amount"] == [1, None]
+    assert columns["Tags"] == ['["x"]', None]
+    assert columns["Done"] == [False, True]
+
+
+def test_to_columns_mismatched_values():
+    records = [
+        {"id": "rec1", "fields": {"Name": ["x"], "Amount": {"error": "#ERROR!"}}},
+        {"id": "rec2", "fields": {"Name": "B", "Amount": "1", "Count": 3.0}},
+        {"id": "rec3", "fields": {"Name": 3, "Count": True, "Done": "yes"}},
+    ]
+    schema = {"Name": "str", "Amount": "float", "Count": "int", "Done": "bool"}
+    columns = to_columns(records, schema)
+    assert columns["Name"] == [None, "B", None]
+    assert columns["Amount"] == [None, None, None]
+    assert columns["Count"] == [None, 3, None]
+    assert columns["Done"] == [False, False, None]
+
+
+def test_iter_batches_invalid_type(table):
+    with pytest.raises(ValueError):
+        next(iter_batches(table, schema={"Name": "text"}, backend="numpy"))
+
+
+def test_iter_batches_numpy(table, mock_pages):
+    numpy = pytest.importorskip("numpy")
+    with Mocker() as mock:
+        mock_pages(mock)
+        batches = list(iter_batches(table, columns=["Amount", "Name"], backend="numpy"))
+        assert mock.request_history[0].qs["fields[]"] == ["amount", "name"]
+
+    first, second = batches
+    assert first["Amount"].dtype == numpy.float64
+    assert list(second["id"]) == ["rec2"]
+    assert second["Name"].mask.tolist() == [True]
+    assert second["Amount"].tolist() == [2.5]
+
+
+def test_iter_batches_arrow(table, mock_pages):
+    pyarrow = pytest.importorskip("pyarrow")
+    schema = {"Name": "str", "Amount": "float", "Done": "bool"}
+    with Mocker() as mock:
+        mock_pages(mock)
+        batches = list(iter_batches(table, schema=schema, backend="arrow"))
+
+    assert batches[0].schema == batches[1].schema
+    assert batches[0].schema.field("Amount").type == pyarrow.float64()
+    assert batches[1].column("Name").null_count == 1
+    assert batches[1].column("Done").to_pylist() == [True]
+
+
+def test_iter_batches_columns_required(table):
+    with Mocker() as mock:
+        with pytest.raises(ValueError):
+            next(iter_batches(table, backend="numpy"))
+        assert mock.call_count == 0
+
+
+def test_iter_batches_inferred_types(table, mock_pages):
+    pytest.importorskip("numpy")
+    with Mocker() as mock:
+        mock_pages(mock)
+        columns = ["Name", "Amount", "Done"]
+        first, second = iter_batches(table, columns=columns, backend="numpy")
+
+    assert list(first) == ["id", "Name", "Amount", "Done"]
+    assert second["Done"].mask.tolist() == [True]
+
+
+def test_write_parquet(table, mock_pages, tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "table.parquet")
+    with Mocker() as mock:
+        mock_pages(mock)
+        assert write_parquet(table, path, schema={"Name": "str"}) == 2
+
+    assert parquet.read_table(path).column("id").to_pylist() == ["rec1", "rec2"]
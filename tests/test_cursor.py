@@ -0,0 +1,129 @@
+import json
+
+import pytest
+import requests
+from requests_mock import Mocker
+
+from airtable.cursor import ScanCursor
+
+EXPIRED = {
+    "status_code": 422,
+    "json": {"error": {"type": "LIST_RECORDS_ITERATOR_NOT_AVAILABLE"}},
+}
+
+
+def make_page(start, count, offset=None):
+    records = [
+        {"id": "rec{}".format(n), "fields": {"Number": n}}
+        for n in range(start, start + count)
+    ]
+    page = {"records": records}
+    if offset:
+        page["offset"] = offset
+    return {"json": page}
+
+
+def test_cursor_offset(table):
+    with Mocker() as mock:
+        mock.get(table.url_table, [make_page(0, 2, "itr1"), make_page(2, 2)])
+        cursor = ScanCursor(table, view="View")
+        pages = iter(cursor)
+        next(pages)
+        assert cursor.offset == "itr1"
+        assert (cursor.pages, cursor.records) == (1, 2)
+
+    with Mocker() as mock:
+        mock.get(table.url_table, [make_page(2, 2)])
+        cursor = ScanCursor(table, offset="itr1", view="View")
+        pages = list(cursor)
+        assert mock.request_history[0].qs == {"view": ["view"], "offset": ["itr1"]}
+    assert [r["id"] for r in pages[0]] == ["rec2", "rec3"]
+    assert cursor.done and cursor.offset is None
+
+
+def test_cursor_checkpoint(table, tmp_path):
+    path = str(tmp_path / "scan.json")
+    with Mocker() as mock:
+        mock.get(
+            table.url_table,
+            [make_page(0, 2, "itr1"), make_page(2, 2, "itr2"), make_page(4, 1)],
+        )
+        cursor = ScanCursor(table, checkpoint=path)
+        pages = iter(cursor)
+        next(pages)
+        next(pages)
+        # The second page is saved once the next one is requested
+        with open(path) as checkpoint:
+            assert json.load(checkpoint)["offset"] == "itr1"
+        next(pages)
+        with open(path) as checkpoint:
+            assert json.load(checkpoint)["offset"] == "itr2"
+
+    with Mocker() as mock:
+        mock.get(table.url_table, [make_page(4, 1)])
+        cursor = ScanCursor(table, checkpoint=path)
+        assert cursor.records == 4
+        assert [page[0]["id"] for page in cursor] == ["rec4"]
+        assert mock.request_history[0].qs["offset"] == ["itr2"]
+    assert not (tmp_path / "scan.json").exists()
+
+
+def test_cursor_expired_offset_skip(table):
+    with Mocker() as mock:
+        mock.get(
+            table.url_table,
+            [EXPIRED, make_page(0, 3, "itr9"), make_page(3, 2)],
+        )
+        cursor = ScanCursor(table, offset="itr1", records=2)
+        pages = list(cursor)
+
+    assert [[r["id"] for r in page] for page in pages] == [["rec2"], ["rec3", "rec4"]]
+    assert cursor.restarts == 1
+    assert cursor.records == 5
+
+
+def test_cursor_expired_offset_resume_field(table):
+    with Mocker() as mock:
+        mock.get(
+            table.url_table,
+            [make_page(0, 2, "itr1"), EXPIRED, make_page(2, 1)],
+        )
+        cursor = ScanCursor(table, resume_field="Number", formula="{A}=1")
+        pages = list(cursor)
+        first, expired, restarted = mock.request_history
+
+    assert first.qs["sort[0][field]"] == ["number"]
+    assert "filterbyformula" in first.qs
+    assert restarted.qs["filterbyformula"] == ["and({a}=1, {number}>1)"]
+    assert "offset" not in restarted.qs
+    assert [page[-1]["id"] for page in pages] == ["rec1", "rec2"]
+
+
+def test_cursor_expired_offset_unknown_position(table):
+    with Mocker() as mock:
+        mock.get(table.url_table, [EXPIRED, make_page(0, 3)])
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(ScanCursor(table, offset="itr1"))
+        assert mock.call_count == 1
+
+
+def test_cursor_resume_field_empty_value(table):
+    last = {"id": "rec2", "fields": {}}
+    first_page = make_page(0, 2, "itr1")
+    first_page["json"]["records"].append(last)
+    with Mocker() as mock:
+        mock.get(table.url_table, [first_page, EXPIRED, make_page(2, 1)])
+        cursor = ScanCursor(table, resume_field="Number")
+        pages = list(cursor)
+        restarted = mock.request_history[-1]
+
+    assert restarted.qs["filterbyformula"] == ["{number}>1"]
+    assert cursor.resume_value == 2
+    assert len(pages) == 2
+
+
+def test_cursor_other_errors(table):
+    with Mocker() as mock:
+        mock.get(table.url_table, status_code=422, json={"error": "OTHER"})
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(ScanCursor(table, offset="itr1"))
@@ -98,3 +98,47 @@ def test_formula_from_name_and_value():
 
     formula = AirtableParams.FormulaParam.from_name_and_value("COL", 8)
     assert formula == r"{COL}=8"
+
+
+def test_formula_from_name_and_values():
+    from_name_and_values = AirtableParams.FormulaParam.from_name_and_values
+    formulas = from_name_and_values("COL", ["A", "B", 8])
+    assert formulas == [r"OR({COL}='A',{COL}='B',{COL}=8)"]
+
+    formulas = from_name_and_values("COL", ["A", "B", 8], max_length=20)
+    assert formulas == [r"OR({COL}='A')", r"OR({COL}='B')", r"OR({COL}=8)"]
+    assert all(len(f) <= 20 for f in formulas)
+
+    assert from_name_and_values("COL", []) == []
+
+
+def test_formula_or_chunks():
+    or_chunks = AirtableParams.FormulaParam.or_chunks
+    assert or_chunks(["A=1", "B=2"]) == ["OR(A=1,B=2)"]
+    assert or_chunks(["A=1", "B=2"], max_length=10) == ["OR(A=1)", "OR(B=2)"]
+
+
+@pytest.mark.parametrize(
+    "kwargs,body",
+    [
+        ({"view": "View"}, {"view": "View"}),
+        ({"max_records": 5}, {"maxRecords": 5}),
+        ({"fields": "Name"}, {"fields": ["Name"]}),
+        ({"fields": ("A", "B")}, {"fields": ["A", "B"]}),
+        ({"sort": "-Name"}, {"sort": [{"field": "Name", "direction": "desc"}]}),
+        ({"formula": "{A}=1", "offset": None}, {"filterByFormula": "{A}=1"}),
+    ],
+)
+def test_process_body(table, kwargs, body):
+    assert table._process_body(kwargs) == body
+
+
+def test_compile_query(table):
+    options = {"view": "My View", "fields": ["A", "B"], "sort": "-A"}
+    query = table._compile_query(table.url_table, options)
+    params = dict(table._process_params(options), offset="itr1/rec1")
+    request = requests.Request("get", table.url_table, params=params)
+
+    assert query.body is None
+    assert query.page_url("itr1/rec1") == request.prepare().url
+    assert query.page_url() == query.url + "?" + query.query
@@ -0,0 +1,79 @@
+import pytest
+from requests_mock import Mocker
+
+from airtable import Airtable
+from airtable.rate_limit import AsyncRateLimiter, RateLimiter
+
+
+def test_acquire_waits_only_when_empty(fake_time):
+    limiter = RateLimiter(interval=0.2)
+    assert limiter.acquire() == 0
+    # Slow request: bucket is refilled when the next one is sent
+    fake_time.now += 0.6
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.2)
+    assert fake_time.sleeps == [pytest.approx(0.2)]
+
+
+def test_acquire_burst(fake_time):
+    limiter = RateLimiter(interval=0.2, burst=3)
+    waits = [limiter.acquire() for _ in range(5)]
+    assert waits == [0, 0, 0, pytest.approx(0.2), pytest.approx(0.2)]
+
+
+def test_acquire_interval_override(fake_time):
+    limiter = RateLimiter(interval=0.2)
+    assert limiter.acquire(interval=0) == 0
+    assert limiter.acquire(interval=0) == 0
+
+
+def test_shared_per_base_key():
+    table_a = Airtable("appSharedLimiter", "A", api_key="x")
+    table_b = Airtable("appSharedLimiter", "B", api_key="x")
+    table_c = Airtable("appOtherLimiter", "A", api_key="x")
+    assert table_a.rate_limiter is table_b.rate_limiter
+    assert table_a.rate_limiter is not table_c.rate_limiter
+
+
+def test_request_acquires_token(table):
+    class CountingLimiter(RateLimiter):
+        calls = 0
+
+        def acquire(self, interval=None):
+            self.calls += 1
+            return 0
+
+    table.rate_limiter = CountingLimiter()
+    with Mocker() as mock:
+        mock.get(table.record_url("rec1"), json={"id": "rec1"})
+        table.get("rec1")
+        table.get("rec1")
+    assert table.rate_limiter.calls == 2
+
+
+def test_custom_limiter_interval(make_table, fake_time):
+    table = make_table(rate_limiter=RateLimiter(interval=1.0))
+    assert table.API_LIMIT == 1.0
+    fake_time.sleeps = []
+    with Mocker() as mock:
+        mock.get(table.record_url("rec1"), json={"id": "rec1"})
+        for _ in range(3):
+            table.get("rec1")
+    assert fake_time.sleeps == [1.0, 1.0]
+
+
+def test_api_limit_sets_own_limiter():
+    table = Airtable("appApiLimit", "A", api_key="x")
+    other = Airtable("appApiLimit", "B", api_key="x")
+    shared = table.rate_limiter
+    table.API_LIMIT = 0.5
+    assert table.API_LIMIT == table.rate_limiter.interval == 0.5
+    assert table.rate_limiter is not shared
+    assert other.API_LIMIT == shared.interval == 0.2
+    assert Airtable("appApiLimit", "C", api_key="x").rate_limiter is shared
+    assert Airtable.API_LIMIT == 0.2
+
+
+def test_shared_limiters_reset():
+    assert RateLimiter._shared == {}
+    assert AsyncRateLimiter._shared == {}
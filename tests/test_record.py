@@ -0,0 +1,71 @@
+import pytest
+from requests_mock import Mocker
+
+from airtable import Record
+
+
+@pytest.fixture
+def record_dict():
+    return {
+        "id": "rec1",
+        "fields": {"Name": "John", "Tags": ["a", "b"]},
+        "createdTime": "2020-01-01T00:00:00.000Z",
+    }
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_record_dict_compatible(record_dict, lazy):
+    record = Record.from_dict(record_dict, lazy=lazy)
+
+    assert record == record_dict
+    assert record_dict == record
+    assert record.id == record["id"] == "rec1"
+    assert record["fields"]["Tags"] == ["a", "b"]
+    assert record.get("createdTime") == record_dict["createdTime"]
+    assert record.get("missing") is None
+    assert "fields" in record
+    assert sorted(record) == sorted(record_dict)
+    assert record.to_dict() == record_dict
+
+    record["fields"]["Name"] = "Marc"
+    assert record.fields["Name"] == "Marc"
+    with pytest.raises(KeyError):
+        record["other"] = 1
+
+
+def test_record_lazy_fields(record_dict):
+    record = Record.from_dict(record_dict, lazy=True)
+    assert isinstance(record._fields, str)
+    assert record.fields == record_dict["fields"]
+    assert record.fields is record.fields
+
+
+def test_record_lazy_fields_non_ascii():
+    fields = {"Nom": "Café ☃ 日本", "Notes": ["é"]}
+    record = Record.from_dict({"id": "rec1", "fields": fields}, lazy=True)
+    assert "Café ☃ 日本" in record._fields
+    assert "\\u" not in record._fields
+    assert record.fields == fields
+
+
+def test_record_interned_field_names():
+    first = Record.from_dict({"id": "rec1", "fields": {"".join(["Na", "me"]): 1}})
+    second = Record.from_dict({"id": "rec2", "fields": {"".join(["Nam", "e"]): 2}})
+    assert list(first.fields)[0] is list(second.fields)[0]
+
+
+def test_record_without_created_time():
+    record = Record("rec1", {})
+    assert len(record) == 2
+    assert "createdTime" not in record
+    with pytest.raises(AttributeError):
+        record.other = 1
+
+
+def test_get_all_compact(table, mock_response_list, mock_records):
+    with Mocker() as mock:
+        mock.get(table.url_table, [{"json": page} for page in mock_response_list])
+        records = table.get_all(compact=True, lazy=True)
+
+    assert all(isinstance(record, Record) for record in records)
+    assert records == mock_records
@@ -0,0 +1,67 @@
+import pytest
+from requests_mock import Mocker
+
+from airtable.replica import SQLiteReplica
+
+
+@pytest.fixture
+def replica(table, tmpdir):
+    path = str(tmpdir.join("replica.db"))
+    return SQLiteReplica(table, "Value", path, indexed_fields=["Value"])
+
+
+def test_refresh_and_query(replica, mock_records):
+    with Mocker() as mock:
+        mock.get(replica.sync.airtable.url_table, json={"records": mock_records})
+        result = replica.refresh()
+    assert len(result.added) == len(replica) == 3
+
+    assert replica.get(mock_records[1]["id"]) == mock_records[1]
+    assert replica.get("recMissing") is None
+    assert replica.match("Value", "xyz") == mock_records[2]
+    assert replica.match("Value", "nope") == {}
+    assert replica.search("SameField", 456) == [mock_records[1]]
+
+
+def test_indexed_field_uses_index(replica):
+    plan = replica.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM records WHERE {}".format(
+            replica._where("Value")
+        ),
+        ("abc",),
+    ).fetchall()
+    assert "index:Value" in str(plan)
+
+
+def test_incremental_refresh_persisted(replica, table, tmpdir, mock_records):
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": mock_records})
+        replica.refresh()
+    replica.close()
+
+    # Reopened replica continues from the stored high water mark
+    path = str(tmpdir.join("replica.db"))
+    replica = SQLiteReplica(table, "Value", path, indexed_fields=["Value"])
+    modified = dict(mock_records[0], fields={"Value": "changed"})
+
+    def _list_records(request, context):
+        if "filterbyformula" in request.qs:
+            return {"records": [modified]}
+        return {"records": [{"id": modified["id"]}]}
+
+    with Mocker() as mock:
+        mock.get(table.url_table, json=_list_records)
+        result = replica.refresh()
+
+    assert result.updated == [modified]
+    assert len(result.deleted) == 2
+    assert replica.all() == [modified]
+    assert replica.match("Value", "changed") == modified
+
+
+def test_old_sqlite_without_indexed_fields(table, monkeypatch):
+    monkeypatch.setattr("airtable.replica.sqlite3.sqlite_version_info", (3, 30, 0))
+    replica = SQLiteReplica(table, "Value")
+    replica.close()
+    with pytest.raises(RuntimeError):
+        SQLiteReplica(table, "Value", indexed_fields=["Value"])
@@ -0,0 +1,99 @@
+import pytest
+import requests
+from requests_mock import Mocker
+
+from airtable.rate_limit import RateLimiter
+from airtable.retry import RetryPolicy
+
+
+@pytest.fixture
+def retry_table(make_table, fake_time):
+    return make_table(
+        rate_limiter=RateLimiter(), retry_policy=RetryPolicy(max_retries=2)
+    )
+
+
+def test_retry_after_header(retry_table, fake_time, mock_response_single):
+    url = retry_table.record_url("rec1")
+    with Mocker() as mock:
+        mock.get(
+            url,
+            [
+                {"status_code": 429, "headers": {"Retry-After": "30"}},
+                {"status_code": 200, "json": mock_response_single},
+            ],
+        )
+        resp = retry_table.get("rec1")
+
+    assert resp == mock_response_single
+    assert retry_table.retry_policy.retries == 1
+    assert retry_table.retry_policy.backoff_time == 30
+    assert fake_time.sleeps == [pytest.approx(30)]
+
+
+def test_retry_exponential_backoff(retry_table, fake_time):
+    url = retry_table.record_url("rec1")
+    with Mocker() as mock:
+        mock.get(url, status_code=503)
+        with pytest.raises(requests.exceptions.HTTPError):
+            retry_table.get("rec1")
+        assert mock.call_count == 3
+
+    policy = retry_table.retry_policy
+    assert policy.retries == 2
+    assert 0.25 <= fake_time.sleeps[0] <= 0.5
+    assert 0.5 <= fake_time.sleeps[1] <= 1.0
+    assert policy.backoff_time == pytest.approx(sum(fake_time.sleeps))
+
+
+def test_no_retry_non_idempotent_server_error(retry_table):
+    with Mocker() as mock:
+        mock.post(retry_table.url_table, status_code=503)
+        with pytest.raises(requests.exceptions.HTTPError):
+            retry_table.insert({"Value": "abc"})
+        assert mock.call_count == 1
+
+
+def test_retry_non_idempotent_rate_limit(retry_table, mock_response_single):
+    with Mocker() as mock:
+        mock.post(
+            retry_table.url_table,
+            [{"status_code": 429}, {"status_code": 200, "json": mock_response_single}],
+        )
+        resp = retry_table.insert({"Value": "abc"})
+        assert mock.call_count == 2
+    assert resp == mock_response_single
+
+
+def test_retry_list_records_server_error(retry_table, mock_response_single):
+    retry_table.MAX_URL_LENGTH = 0
+    url = retry_table.url_table + "/listRecords"
+    with Mocker() as mock:
+        mock.post(
+            url,
+            [{"status_code": 503}, {"status_code": 200, "json": {"records": []}}],
+        )
+        assert retry_table.get_all(view="View") == []
+        assert mock.call_count == 2
+
+
+def test_retry_connection_error(retry_table, mock_response_single):
+    url = retry_table.record_url("rec1")
+    with Mocker() as mock:
+        mock.get(
+            url,
+            [
+                {"exc": requests.exceptions.ConnectionError},
+                {"status_code": 200, "json": mock_response_single},
+            ],
+        )
+        assert retry_table.get("rec1") == mock_response_single
+
+
+def test_no_retry_client_error(retry_table):
+    with Mocker() as mock:
+        mock.get(retry_table.record_url("rec1"), status_code=404)
+        with pytest.raises(requests.exceptions.HTTPError):
+            retry_table.get("rec1")
+        assert mock.call_count == 1
+    assert retry_table.retry_policy.retries == 0
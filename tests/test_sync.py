@@ -0,0 +1,74 @@
+import pytest
+from requests_mock import Mocker
+
+from airtable.sync import TableSync
+
+
+@pytest.fixture
+def sync(table):
+    return TableSync(table, "Value", view="View")
+
+
+def test_first_sync(sync, mock_records):
+    with Mocker() as mock:
+        mock.get(sync.airtable.url_table, json={"records": mock_records})
+        result = sync.sync()
+        qs = mock.last_request.qs
+    assert "filterbyformula" not in qs
+    assert qs["view"] == ["view"]
+    assert result.added == mock_records
+    assert result.updated == result.deleted == []
+    assert sorted(sync.records) == sorted(r["id"] for r in mock_records)
+    assert sync.high_water_mark.endswith("Z")
+
+
+def test_incremental_sync(sync, mock_records):
+    sync.records = {r["id"]: r for r in mock_records}
+    sync.high_water_mark = "2020-01-01T00:00:00.000Z"
+    modified = dict(mock_records[0], fields={"Value": "changed"})
+    new = {"id": "recNew", "fields": {"Value": "new"}}
+
+    def _list_records(request, context):
+        if "filterbyformula" in request.qs:
+            return {"records": [modified, new]}
+        return {"records": [{"id": modified["id"]}, {"id": new["id"]}]}
+
+    with Mocker() as mock:
+        mock.get(sync.airtable.url_table, json=_list_records)
+        result = sync.sync()
+        modified_request, scan_request = mock.request_history
+
+    formula = modified_request.qs["filterbyformula"][0]
+    assert formula.startswith("is_after(last_modified_time()")
+    assert "2020-01-01t00:00:00.000z" in formula
+    assert scan_request.qs["fields[]"] == ["value"]
+    assert result.added == [new]
+    assert result.updated == [modified]
+    assert result.deleted == [r["id"] for r in mock_records[1:]]
+    assert sorted(sync.records) == sorted([modified["id"], new["id"]])
+
+
+def test_scan_retrieves_scan_field_only(table):
+    sync = TableSync(table, "Value", fields=["Value", "Notes"])
+    sync.high_water_mark = "2020-01-01T00:00:00.000Z"
+    with Mocker() as mock:
+        mock.get(table.url_table, json={"records": []})
+        sync.sync()
+        modified_request, scan_request = mock.request_history
+
+    assert modified_request.qs["fields[]"] == ["value", "notes"]
+    assert scan_request.qs["fields[]"] == ["value"]
+
+
+def test_scan_field_required(table):
+    with pytest.raises(TypeError):
+        TableSync(table)
+
+
+def test_formula_combined(table):
+    sync = TableSync(table, "Value", formula="{Value}='abc'")
+    sync.high_water_mark = "2020-01-01T00:00:00.000Z"
+    assert sync._formula(sync.modified_formula()) == (
+        "AND({Value}='abc', IS_AFTER(LAST_MODIFIED_TIME(), "
+        "DATETIME_PARSE('2020-01-01T00:00:00.000Z')))"
+    )